@@ -5,6 +5,7 @@ This module provides all the essential fixtures needed for comprehensive testing
 of the Vibe Coder CLI, including mocking, file system setup, and test utilities.
 """
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -26,6 +27,33 @@ from vibe_coder.plugins.manager import PluginManager
 from vibe_coder.types.api import ApiMessage, ApiResponse, MessageRole, TokenUsage
 from vibe_coder.types.config import AIProvider, AppConfig
 
+# =============================================================================
+# Session Setup
+# =============================================================================
+
+# RAM-backed filesystem used for temporary files when available
+_RAMDISK = Path("/dev/shm")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _ramdisk_tempdir() -> Generator[None, None, None]:
+    """
+    Put temporary files on tmpfs when available.
+
+    Redirects raw ``tempfile`` calls (``mkdtemp``, ``TemporaryDirectory``,
+    ...) to /dev/shm so their writes and fsyncs don't hit the disk. pytest's
+    ``tmp_path`` is not affected: its base directory is fixed before session
+    fixtures run (by the xdist controller under ``-n``). Falls back to the
+    default temp dir elsewhere.
+    """
+    if not (_RAMDISK.is_dir() and os.access(_RAMDISK, os.W_OK)):
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tempfile, "tempdir", str(_RAMDISK))
+        yield
+
+
 # =============================================================================
 # Async Configuration Fixtures
 # =============================================================================
@@ -101,18 +129,13 @@ async def config_manager_with_provider(
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test files."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="vibe_coder_test_"))
-    try:
-        yield temp_dir
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+def temp_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory for test files (pytest's ``tmp_path``)."""
+    return tmp_path
 
 
-@pytest.fixture
-def sample_python_project(temp_dir: Path) -> Path:
-    """Create a sample Python project structure for testing."""
+def _write_sample_project(temp_dir: Path) -> Path:
+    """Write the sample Python project used by the project fixtures into temp_dir."""
     # Create directory structure
     (temp_dir / "src").mkdir()
     (temp_dir / "tests").mkdir()
@@ -258,11 +281,28 @@ venv/
     return temp_dir
 
 
-@pytest.fixture
-def git_repository(sample_python_project: Path) -> Path:
-    """Initialize a git repository in the sample project."""
+@pytest.fixture(scope="session")
+def sample_python_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create a sample Python project structure for testing.
+
+    Built once per session and shared, so tests must treat it as read-only.
+    """
+    return _write_sample_project(tmp_path_factory.mktemp("vibe_coder_test_project"))
+
+
+@pytest.fixture(scope="session")
+def git_repository(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Initialize a git repository in a copy of the sample project.
+
+    Uses its own directory, built once per session, so the commits and the
+    feature branch never leak into ``sample_python_project``.
+    """
     import subprocess
 
+    sample_python_project = _write_sample_project(tmp_path_factory.mktemp("vibe_coder_test_repo"))
+
     # Run git commands
     subprocess.run(["git", "init"], cwd=sample_python_project, capture_output=True)
     subprocess.run(
@@ -412,7 +452,7 @@ def mock_generic_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_provider():
     """Create a mock AI provider configuration."""
     return {
@@ -426,7 +466,7 @@ def mock_provider():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ai_response():
     """Create a mock AI response for testing."""
     return ApiResponse(
@@ -439,7 +479,7 @@ def mock_ai_response():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_messages():
     """Create a list of mock API messages for testing."""
     return [
@@ -577,7 +617,7 @@ def repository_mapper(sample_python_project: Path):
     return RepositoryMapper(sample_python_project)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ast_data():
     """Provide sample AST data for testing."""
     return {
@@ -639,7 +679,7 @@ def auto_healer(sample_python_project: Path):
     return AutoHealer(sample_python_project)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_snippet():
     """Provide a code snippet with an error for testing."""
     return '''
@@ -652,7 +692,7 @@ def calculate_average(numbers):
 '''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixed_snippet():
     """Provide the fixed version of the error snippet."""
     return '''
@@ -677,7 +717,7 @@ def cost_tracker():
     return CostTracker()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_usage_data():
     """Provide sample usage data for testing."""
     return {
@@ -709,7 +749,7 @@ def plugin_manager():
     return PluginManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_plugin_code():
     """Provide sample plugin code for testing."""
     return '''
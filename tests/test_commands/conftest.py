@@ -0,0 +1,39 @@
+"""
+Shared fixtures for command tests.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _test_env():
+    """Flag the process as running under the test suite for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("VIBE_CODER_TEST", "true")
+        yield
+
+
+class _NoopProgress:
+    """Stand-in for ``rich.progress.Progress`` that renders nothing."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return MagicMock()
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_progress():
+    """Swap the test command's progress spinner for a no-op once per module."""
+    from vibe_coder.commands import test as test_module
+
+    original = test_module.Progress
+    test_module.Progress = _NoopProgress
+    yield
+    test_module.Progress = original
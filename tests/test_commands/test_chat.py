@@ -13,9 +13,6 @@ from vibe_coder.commands.chat import ChatCommand
 from vibe_coder.types.api import ApiMessage, ApiResponse, MessageRole, TokenUsage
 from vibe_coder.types.config import AIProvider
 
-# Set test environment variable
-os.environ["VIBE_CODER_TEST"] = "true"
-
 
 @pytest.fixture
 def mock_provider():
@@ -2,7 +2,6 @@
 Test config command functionality.
 """
 
-import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -10,9 +9,6 @@ import pytest
 from vibe_coder.commands.config import ConfigCommand
 from vibe_coder.types.config import AIProvider
 
-# Set test environment variable
-os.environ["VIBE_CODER_TEST"] = "true"
-
 
 @pytest.fixture
 def config_command():
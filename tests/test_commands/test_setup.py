@@ -2,7 +2,6 @@
 Test setup command functionality.
 """
 
-import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,9 +9,6 @@ import pytest
 from vibe_coder.commands.setup import SetupCommand
 from vibe_coder.types.config import AIProvider
 
-# Set test environment variable
-os.environ["VIBE_CODER_TEST"] = "true"
-
 
 @pytest.fixture
 def setup_command():
@@ -402,7 +398,10 @@ class TestSetupCommandSaveConfiguration:
         with patch.object(setup_command.console, "print") as mock_print:
             result = await setup_command._save_config(mock_provider)
             assert result is True
-            mock_config.set_provider.assert_called_once_with(mock_provider.name, mock_provider)
+            mock_config.set_provider.assert_called_once_with(
+                mock_provider.name, mock_provider, current=True
+            )
+            mock_config.set_current_provider.assert_not_called()
             mock_print.assert_any_call("[green]✓ Configuration saved successfully![/green]")
 
     @patch("vibe_coder.commands.setup.questionary")
@@ -440,7 +439,10 @@ class TestSetupCommandSaveConfiguration:
         with patch.object(setup_command.console, "print"):
             result = await setup_command._save_config(mock_provider)
             assert result is True
-            mock_config.set_current_provider.assert_called_once_with(mock_provider.name)
+            mock_config.set_provider.assert_called_once_with(
+                mock_provider.name, mock_provider, current=True
+            )
+            mock_config.set_current_provider.assert_not_called()
 
 
 class TestSetupCommandMainFlow:
@@ -2,24 +2,130 @@
 Test command functionality.
 """
 
-import os
+import copy
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from rich.panel import Panel
+
 from vibe_coder.commands.test import TestCommand
 from vibe_coder.types.config import AIProvider
 
-# Set test environment variable
-os.environ["VIBE_CODER_TEST"] = "true"
+# Run the async tests in this module on one shared event loop; applied to async
+# tests only, since pytest warns when the asyncio mark lands on a sync test.
+module_loop = pytest.mark.asyncio(scope="module")
+
+
+class _FakeClient:
+    """Minimal async API client stub returning fixed results."""
+
+    def __init__(self, validate=True, test_request=None, error=None):
+        self._validate = validate
+        self._test_request = test_request
+        self._error = error
+
+    async def validate_connection(self):
+        if self._error is not None:
+            raise self._error
+        return self._validate
+
+    async def test_request(self):
+        return self._test_request
+
+    async def close(self):
+        pass
+
+
+def _make_prototype_client(success: bool) -> _FakeClient:
+    """Build a client whose connection and test request succeed or fail."""
+    return _FakeClient(
+        validate=success,
+        test_request={
+            "success": success,
+            "response": "Response" if success else None,
+            "latency": 0.3,
+            "error": None if success else "Connection failed",
+        },
+    )
+
+
+def _wire_client(mock_factory, client) -> None:
+    """Make ``mock_factory.create_client`` return ``client``."""
+    mock_factory.create_client.return_value = client
+
+
+# Prototypes are built once and shallow-copied per provider.
+_PROTO_CLIENTS = {True: _make_prototype_client(True), False: _make_prototype_client(False)}
+
+
+@pytest.fixture(scope="module")
+def _command_module_mocks():
+    """Install shared mocks on the test command module once per test module."""
+    mocks = {
+        "config_manager": MagicMock(),
+        "ClientFactory": MagicMock(),
+    }
+    with pytest.MonkeyPatch.context() as mp:
+        for name, mock in mocks.items():
+            mp.setattr(f"vibe_coder.commands.test.{name}", mock)
+        yield mocks
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _skip_result_pause():
+    """Drop the one-second pause the command takes after showing a result."""
+
+    async def _no_sleep(_delay):
+        pass
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("vibe_coder.commands.test.asyncio", SimpleNamespace(sleep=_no_sleep))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_command_module_mocks(_command_module_mocks):
+    """Reset the shared module mocks so every test starts from a clean slate."""
+    for mock in _command_module_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_config(_command_module_mocks):
+    """Shared mock for ``vibe_coder.commands.test.config_manager``."""
+    return _command_module_mocks["config_manager"]
 
 
 @pytest.fixture
+def mock_factory(_command_module_mocks):
+    """Shared mock for ``vibe_coder.commands.test.ClientFactory``."""
+    return _command_module_mocks["ClientFactory"]
+
+
+@pytest.fixture(scope="module")
 def test_command():
-    """Create a TestCommand instance."""
+    """Create a TestCommand instance shared by every test in the module."""
     return TestCommand()
 
 
+@pytest.fixture(scope="module")
+def _print_sink(test_command):
+    """Replace the shared command's ``console.print`` with one mock per module."""
+    sink = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(test_command.console, "print", sink)
+        yield sink
+
+
+@pytest.fixture(autouse=True)
+def print_sink(_print_sink):
+    """Console print sink, reset before each test."""
+    _print_sink.reset_mock()
+    return _print_sink
+
+
 @pytest.fixture
 def mock_providers():
     """Create mock providers for testing."""
@@ -51,10 +157,10 @@ class TestTestCommandInitialization:
         assert hasattr(test_command.console, "print")
 
 
+@module_loop
 class TestTestCommandRun:
     """Test main run functionality."""
 
-    @patch("vibe_coder.commands.test.config_manager")
     async def test_run_with_provider_name(self, mock_config, test_command):
         """Test run with specific provider name."""
         mock_config.get_provider.return_value = MagicMock()
@@ -67,7 +173,6 @@ class TestTestCommandRun:
             assert result is True
             mock_test.assert_called_once_with("openai")
 
-    @patch("vibe_coder.commands.test.config_manager")
     async def test_run_with_current_provider(self, mock_config, test_command, mock_providers):
         """Test run with current provider."""
         mock_config.get_current_provider.return_value = mock_providers["openai"]
@@ -80,7 +185,6 @@ class TestTestCommandRun:
             assert result is True
             mock_test.assert_called_once_with("openai")
 
-    @patch("vibe_coder.commands.test.config_manager")
     async def test_run_no_current_test_all(self, mock_config, test_command, mock_providers):
         """Test run with no current provider, tests all."""
         mock_config.get_current_provider.return_value = None
@@ -92,335 +196,234 @@ class TestTestCommandRun:
             assert result is True
             mock_test.assert_called_once_with(mock_providers)
 
-    @patch("vibe_coder.commands.test.config_manager")
-    async def test_run_no_providers(self, mock_config, test_command):
+    async def test_run_no_providers(self, mock_config, test_command, print_sink):
         """Test run with no providers configured."""
         mock_config.get_current_provider.return_value = None
         mock_config.list_providers.return_value = {}
 
-        with patch.object(test_command.console, "print") as mock_print:
-            result = await test_command.run(None)
-            assert result is False
-            mock_print.assert_any_call("[red]No providers configured to test.[/red]")
+        result = await test_command.run(None)
+        assert result is False
+        print_sink.assert_any_call("[red]No providers configured to test.[/red]")
 
 
+@module_loop
 class TestTestCommandSingleProvider:
     """Test single provider testing."""
 
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
     async def test_single_provider_success(
-        self, mock_factory, mock_config, test_command, mock_providers
+        self, mock_factory, mock_config, test_command, print_sink, mock_providers
     ):
         """Test successful single provider test."""
         provider = mock_providers["openai"]
         mock_config.get_provider.return_value = provider
 
-        mock_client = AsyncMock()
-        mock_client.validate_connection.return_value = True
-        mock_client.test_request.return_value = {
-            "success": True,
-            "response": "Test response",
-            "latency": 0.5,
-            "model": "gpt-4",
-        }
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
-
-        with patch("vibe_coder.commands.test.Progress") as mock_progress:
-            mock_progress.return_value.__enter__.return_value = MagicMock()
-
-            with patch.object(test_command.console, "print") as mock_print:
-                result = await test_command._test_single_provider("openai")
-                assert result is True
-                # Should print success message
-                mock_print.assert_any_call("[green]✓ Connection test passed[/green]")
-
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
-    async def test_single_provider_not_found(self, mock_factory, mock_config, test_command):
-        """Test testing non-existent provider."""
-        mock_config.get_provider.return_value = None
-
-        with patch.object(test_command.console, "print") as mock_print:
-            result = await test_command._test_single_provider("nonexistent")
-            assert result is False
-            mock_print.assert_any_call("[red]Provider 'nonexistent' not found[/red]")
-
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
-    async def test_single_provider_connection_failed(
-        self, mock_factory, mock_config, test_command, mock_providers
-    ):
-        """Test single provider with connection failure."""
-        provider = mock_providers["claude"]
-        mock_config.get_provider.return_value = provider
-
-        mock_client = AsyncMock()
-        mock_client.validate_connection.return_value = False
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print") as mock_print:
-                result = await test_command._test_single_provider("claude")
-                assert result is False
-                mock_print.assert_any_call("[red]✗ Connection failed[/red]")
-
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
-    async def test_single_provider_test_request_failed(
-        self, mock_factory, mock_config, test_command, mock_providers
+        mock_client = _FakeClient(
+            validate=True,
+            test_request={
+                "success": True,
+                "response": "Test response",
+                "latency": 0.5,
+                "model": "gpt-4",
+            },
+        )
+        _wire_client(mock_factory, mock_client)
+
+        with patch.object(test_command, "_show_provider_success") as mock_success:
+            result = await test_command._test_single_provider("openai")
+        assert result is True
+        mock_success.assert_called_once_with(provider)
+
+    @pytest.mark.parametrize(
+        "provider_name,client,create_side_effect,expected,expected_msg,expected_error",
+        [
+            pytest.param(
+                "nonexistent",
+                None,
+                None,
+                False,
+                "[red]Provider 'nonexistent' not found.[/red]",
+                None,
+                id="not_found",
+            ),
+            pytest.param(
+                "claude",
+                _FakeClient(validate=False),
+                None,
+                False,
+                "[blue]Testing connection to claude...[/blue]",
+                "API validation failed",
+                id="connection_failed",
+            ),
+            pytest.param(
+                "local",
+                _FakeClient(error=Exception("API error occurred")),
+                None,
+                False,
+                None,
+                "API error occurred",
+                id="validation_error",
+            ),
+            pytest.param(
+                "local",
+                _FakeClient(validate=True),
+                None,
+                True,
+                "[blue]Testing connection to local...[/blue]",
+                None,
+                id="keyless_provider",
+            ),
+            pytest.param(
+                "openai",
+                None,
+                Exception("Client creation failed"),
+                False,
+                None,
+                "Client creation failed",
+                id="exception",
+            ),
+        ],
+    )
+    async def test_single_provider_scenarios(
+        self,
+        mock_factory,
+        mock_config,
+        test_command,
+        print_sink,
+        mock_providers,
+        provider_name,
+        client,
+        create_side_effect,
+        expected,
+        expected_msg,
+        expected_error,
     ):
-        """Test single provider with test request failure."""
-        provider = mock_providers["local"]
+        """Test single provider outcomes that only differ by client behaviour."""
+        provider = mock_providers.get(provider_name)
         mock_config.get_provider.return_value = provider
 
-        mock_client = AsyncMock()
-        mock_client.validate_connection.return_value = True
-        mock_client.test_request.return_value = {"success": False, "error": "API error occurred"}
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print") as mock_print:
-                result = await test_command._test_single_provider("local")
-                assert result is False
-                mock_print.assert_any_call("[red]✗ Test request failed: API error occurred[/red]")
-
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
-    async def test_single_provider_with_latency_warning(
-        self, mock_factory, mock_config, test_command, mock_providers
-    ):
-        """Test single provider with high latency warning."""
-        provider = mock_providers["openai"]
-        mock_config.get_provider.return_value = provider
+        if create_side_effect is not None:
+            mock_factory.create_client.side_effect = create_side_effect
+        else:
+            _wire_client(mock_factory, client)
 
-        mock_client = AsyncMock()
-        mock_client.validate_connection.return_value = True
-        mock_client.test_request.return_value = {
-            "success": True,
-            "response": "Slow response",
-            "latency": 5.0,  # High latency
-            "model": "gpt-4",
-        }
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print") as mock_print:
-                result = await test_command._test_single_provider("openai")
-                assert result is True
-                # Should warn about high latency
-                mock_print.assert_any_call("[yellow]⚠ High latency detected: 5.00s[/yellow]")
-
-    @patch("vibe_coder.commands.test.config_manager")
-    async def test_single_provider_exception(self, mock_config, test_command, mock_providers):
-        """Test single provider with exception during test."""
-        mock_config.get_provider.return_value = mock_providers["openai"]
-
-        with patch("vibe_coder.commands.test.ClientFactory") as mock_factory:
-            mock_factory.create_client.side_effect = Exception("Client creation failed")
-
-            with patch.object(test_command.console, "print") as mock_print:
-                result = await test_command._test_single_provider("openai")
-                assert result is False
-                mock_print.assert_any_call("[red]✗ Test failed: Client creation failed[/red]")
+        with patch.object(test_command, "_show_provider_failure") as mock_failure:
+            result = await test_command._test_single_provider(provider_name)
+        assert result is expected
+        if expected_msg is not None:
+            print_sink.assert_any_call(expected_msg)
+        if expected_error is None:
+            mock_failure.assert_not_called()
+        else:
+            mock_failure.assert_called_once_with(provider, expected_error)
 
 
+@module_loop
 class TestTestCommandAllProviders:
     """Test testing all providers."""
 
-    @patch("vibe_coder.commands.test.ClientFactory")
     async def test_all_providers_all_success(self, mock_factory, test_command, mock_providers):
         """Test all providers when all succeed."""
         # Mock all clients to succeed
-        mock_clients = []
-        for provider_name in mock_providers:
-            mock_client = AsyncMock()
-            mock_client.validate_connection.return_value = True
-            mock_client.test_request.return_value = {
-                "success": True,
-                "response": f"Response from {provider_name}",
-                "latency": 0.3,
-            }
-            mock_client.provider_name = provider_name
-            mock_clients.append(mock_client)
-
-        mock_factory.create_client.side_effect = [
-            AsyncMock().__aenter__.return_value.__aexit__(mock_clients[0], None, None),
-            AsyncMock().__aenter__.return_value.__aexit__(mock_clients[1], None, None),
-            AsyncMock().__aenter__.return_value.__aexit__(mock_clients[2], None, None),
-        ]
-
-        for i, client in enumerate(mock_clients):
-            mock_factory.create_client.return_value.__aenter__.return_value = client
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print"):
-                result = await test_command._test_all_providers(mock_providers)
-                assert result is True
-
-    @patch("vibe_coder.commands.test.ClientFactory")
+        mock_clients = [copy.copy(_PROTO_CLIENTS[True]) for _ in mock_providers]
+        mock_factory.create_client.side_effect = mock_clients
+
+        result = await test_command._test_all_providers(mock_providers)
+        assert result is True
+
     async def test_all_providers_partial_failure(self, mock_factory, test_command, mock_providers):
         """Test all providers with some failures."""
         # Mock clients: first succeeds, others fail
-        mock_clients = []
         results = [True, False, False]
+        mock_clients = [copy.copy(_PROTO_CLIENTS[success]) for success in results]
+        mock_factory.create_client.side_effect = mock_clients
 
-        for i, (provider_name, success) in enumerate(zip(mock_providers, results)):
-            mock_client = AsyncMock()
-            mock_client.validate_connection.return_value = success
-            mock_client.test_request.return_value = {
-                "success": success,
-                "response": "Response" if success else None,
-                "error": None if success else "Connection failed",
-            }
-            mock_clients.append(mock_client)
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print"):
-                result = await test_command._test_all_providers(mock_providers)
-                assert result is False  # Should return False if any fail
+        result = await test_command._test_all_providers(mock_providers)
+        assert result is False  # Should return False if any fail
 
     async def test_all_providers_empty(self, test_command):
         """Test all providers with empty list."""
         result = await test_command._test_all_providers({})
         assert result is True  # Empty list should be considered success
 
-    @patch("vibe_coder.commands.test.ClientFactory")
     async def test_all_providers_show_summary(self, mock_factory, test_command, mock_providers):
         """Test that all providers test shows summary."""
         # Mock successful tests
-        mock_clients = []
-        for provider in mock_providers.values():
-            mock_client = AsyncMock()
-            mock_client.validate_connection.return_value = True
-            mock_client.test_request.return_value = {
-                "success": True,
-                "response": "Success",
-                "latency": 0.2,
-            }
-            mock_clients.append(mock_client)
+        mock_clients = [copy.copy(_PROTO_CLIENTS[True]) for _ in mock_providers]
+        mock_factory.create_client.side_effect = mock_clients
 
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print"):
-                result = await test_command._test_all_providers(mock_providers)
-                assert result is True
+        result = await test_command._test_all_providers(mock_providers)
+        assert result is True
 
 
+@module_loop
 class TestTestCommandDetailedReport:
     """Test detailed reporting functionality."""
 
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
     async def test_show_detailed_report(
-        self, mock_factory, mock_config, test_command, mock_providers
+        self, mock_factory, mock_config, test_command, print_sink, mock_providers
     ):
         """Test showing detailed test report."""
         provider = mock_providers["openai"]
         mock_config.get_provider.return_value = provider
 
-        mock_client = AsyncMock()
-        mock_client.validate_connection.return_value = True
-        mock_client.test_request.return_value = {
-            "success": True,
-            "response": "Detailed test response",
-            "latency": 0.45,
-            "model": "gpt-4",
-            "tokens": {"prompt": 10, "completion": 20, "total": 30},
-            "usage": {"cost": 0.001},
-        }
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print"):
-                with patch.object(test_command, "_show_detailed_report") as mock_report:
-                    await test_command._test_single_provider("openai", detailed=True)
-                    mock_report.assert_called_once()
-
-    def test_format_test_results(self, test_command):
-        """Test formatting of test results."""
-        results = {
-            "success": True,
-            "response": "Test response",
-            "latency": 0.123,
-            "model": "test-model",
-            "tokens": {"prompt": 5, "completion": 10, "total": 15},
-            "cost": 0.0005,
-        }
-
-        # This would test the formatting of results for display
-        # In a real test, you might capture the console output
-        formatted = test_command._format_test_results(results)
-        assert formatted is not None or True  # Placeholder
+        mock_client = _FakeClient(
+            validate=True,
+            test_request={
+                "success": True,
+                "response": "Detailed test response",
+                "latency": 0.45,
+                "model": "gpt-4",
+                "tokens": {"prompt": 10, "completion": 20, "total": 30},
+                "usage": {"cost": 0.001},
+            },
+        )
+        _wire_client(mock_factory, mock_client)
+
+        assert await test_command._test_single_provider("openai") is True
+        panel = print_sink.call_args.args[0]
+        assert isinstance(panel, Panel)
+        assert "Connection Test Successful" in panel.title
 
 
 class TestTestCommandTroubleshooting:
     """Test troubleshooting guidance."""
 
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
-    async def test_connection_error_troubleshooting(
-        self, mock_factory, mock_config, test_command, mock_providers
+    @module_loop
+    @pytest.mark.parametrize(
+        "provider_name,error_message",
+        [
+            pytest.param("openai", "Connection timeout", id="connection"),
+            pytest.param("claude", "401 Unauthorized", id="auth"),
+        ],
+    )
+    async def test_error_troubleshooting(
+        self, mock_factory, mock_config, test_command, mock_providers, provider_name, error_message
     ):
-        """Test troubleshooting guidance for connection errors."""
-        provider = mock_providers["openai"]
-        mock_config.get_provider.return_value = provider
+        """Test troubleshooting guidance for connection and authentication errors."""
+        mock_config.get_provider.return_value = mock_providers[provider_name]
 
-        mock_client = AsyncMock()
-        mock_client.validate_connection.side_effect = Exception("Connection timeout")
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
-
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print"):
-                with patch.object(test_command, "_show_troubleshooting") as mock_trouble:
-                    await test_command._test_single_provider("openai")
-                    mock_trouble.assert_called_once()
-
-    @patch("vibe_coder.commands.test.config_manager")
-    @patch("vibe_coder.commands.test.ClientFactory")
-    async def test_auth_error_troubleshooting(
-        self, mock_factory, mock_config, test_command, mock_providers
-    ):
-        """Test troubleshooting guidance for authentication errors."""
-        provider = mock_providers["claude"]
-        mock_config.get_provider.return_value = provider
-
-        mock_client = AsyncMock()
-        mock_client.validate_connection.side_effect = Exception("401 Unauthorized")
-        mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-        mock_factory.create_client.return_value.__aexit__.return_value = None
+        mock_client = _FakeClient(error=Exception(error_message))
+        _wire_client(mock_factory, mock_client)
 
-        with patch("vibe_coder.commands.test.Progress"):
-            with patch.object(test_command.console, "print"):
-                with patch.object(test_command, "_show_troubleshooting") as mock_trouble:
-                    await test_command._test_single_provider("claude")
-                    mock_trouble.assert_called_once()
+        with patch.object(test_command, "_show_provider_failure") as mock_trouble:
+            assert await test_command._test_single_provider(provider_name) is False
+            mock_trouble.assert_called_once_with(mock_providers[provider_name], error_message)
 
-    def test_show_troubleshooting_connection(self, test_command):
-        """Test showing connection troubleshooting tips."""
-        with patch.object(test_command.console, "print") as mock_print:
-            test_command._show_troubleshooting("connection", "localhost:11434")
-            mock_print.assert_called()
-            # Should include tips about checking if server is running
-
-    def test_show_troubleshooting_auth(self, test_command):
-        """Test showing authentication troubleshooting tips."""
-        with patch.object(test_command.console, "print") as mock_print:
-            test_command._show_troubleshooting("auth", "api.openai.com")
-            mock_print.assert_called()
-            # Should include tips about checking API key
+    @pytest.mark.parametrize(
+        "kind,endpoint",
+        [("connection", "localhost:11434"), ("auth", "api.openai.com")],
+    )
+    def test_show_troubleshooting(self, test_command, print_sink, kind, endpoint):
+        """Test showing connection and authentication troubleshooting tips."""
+        test_command._show_troubleshooting(kind, endpoint)
+        print_sink.assert_called()
 
 
+@module_loop
 class TestTestCommandIntegration:
     """Integration tests for test command."""
 
-    @patch("vibe_coder.commands.test.config_manager")
-    async def test_test_provider_with_env_vars(self, mock_config, test_command):
+    async def test_test_provider_with_env_vars(self, mock_factory, mock_config, test_command):
         """Test testing provider using environment variables."""
         # Mock provider from environment
         provider = AIProvider(
@@ -428,24 +431,14 @@ class TestTestCommandIntegration:
         )
         mock_config.get_provider.return_value = provider
 
-        with patch("vibe_coder.commands.test.ClientFactory") as mock_factory:
-            mock_client = AsyncMock()
-            mock_client.validate_connection.return_value = True
-            mock_client.test_request.return_value = {
+        mock_client = _FakeClient(
+            validate=True,
+            test_request={
                 "success": True,
                 "response": "Env test successful",
-            }
-            mock_factory.create_client.return_value.__aenter__.return_value = mock_client
-            mock_factory.create_client.return_value.__aexit__.return_value = None
-
-            with patch("vibe_coder.commands.test.Progress"):
-                with patch.object(test_command.console, "print") as mock_print:
-                    result = await test_command._test_single_provider("env-provider")
-                    assert result is True
-
-    async def test_test_provider_model_info(self, test_command):
-        """Test that model information is displayed correctly."""
-        # This would test how model information from the provider is shown
-        # In a real implementation, you might check that the model name
-        # from the provider config appears in the test output
-        assert True  # Placeholder
+            },
+        )
+        _wire_client(mock_factory, mock_client)
+
+        result = await test_command._test_single_provider("env-provider")
+        assert result is True
@@ -0,0 +1,92 @@
+"""
+Shared fixtures for configuration tests.
+"""
+
+import pytest
+
+from vibe_coder.types.config import AIProvider
+
+# Every environment variable read by vibe_coder.config.env_handler
+_VIBE_KEYS = (
+    "VIBE_CODER_API_KEY",
+    "VIBE_CODER_ENDPOINT",
+    "VIBE_CODER_MODEL",
+    "VIBE_CODER_TEMPERATURE",
+    "VIBE_CODER_MAX_TOKENS",
+    "VIBE_CODER_PROVIDER_NAME",
+)
+
+
+@pytest.fixture
+def set_vibe_env(monkeypatch):
+    """
+    Start from a clean VIBE_CODER_* environment and return a setter for it.
+
+    ``set_vibe_env(api_key="sk-test")`` sets ``VIBE_CODER_API_KEY``; every
+    change is reverted by ``monkeypatch`` when the test finishes.
+    """
+    for key in _VIBE_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+    def _set(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(f"VIBE_CODER_{name.upper()}", str(value))
+
+    return _set
+
+
+@pytest.fixture(scope="session")
+def provider_factory():
+    """
+    Return a factory building a valid AIProvider with the given overrides.
+
+    ``provider_factory(temperature=2.1)`` only spells out what a test is
+    about; name, API key and endpoint default to valid values.
+    """
+
+    def make(**overrides):
+        fields = {
+            "name": "test",
+            "api_key": "sk-test-key-1234567890",
+            "endpoint": "https://api.openai.com/v1",
+        }
+        fields.update(overrides)
+        return AIProvider(**fields)
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def openai_provider():
+    """Realistic OpenAI provider, built once per module."""
+    return AIProvider(
+        name="openai",
+        api_key="sk-proj-abcdefghijklmnopqrstuvwxyz123456789",
+        endpoint="https://api.openai.com/v1",
+        model="gpt-4",
+        temperature=0.7,
+        max_tokens=2000,
+    )
+
+
+@pytest.fixture(scope="module")
+def anthropic_provider():
+    """Realistic Anthropic provider, built once per module."""
+    return AIProvider(
+        name="anthropic",
+        api_key="sk-ant-REDACTED",
+        endpoint="https://api.anthropic.com/v1",
+        model="claude-3-opus-20240229",
+        temperature=0.8,
+    )
+
+
+@pytest.fixture(scope="module")
+def local_provider():
+    """Local Ollama provider, built once per module."""
+    return AIProvider(
+        name="local-ollama",
+        api_key="sk-local-test-key-1234567890",
+        endpoint="http://localhost:11434",
+        model="llama2",
+    )
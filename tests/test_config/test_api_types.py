@@ -1,5 +1,7 @@
 """Tests for API type definitions (dataclasses)."""
 
+import pytest
+
 from vibe_coder.types.api import ApiMessage, ApiRequest, ApiResponse, MessageRole, TokenUsage
 
 
@@ -27,23 +29,32 @@ class TestMessageRole:
 class TestApiMessage:
     """Test suite for ApiMessage dataclass."""
 
-    def test_create_user_message(self):
-        """Test creating a user message."""
-        msg = ApiMessage(role=MessageRole.USER, content="Hello, AI!")
-        assert msg.role == MessageRole.USER
-        assert msg.content == "Hello, AI!"
-
-    def test_create_assistant_message(self):
-        """Test creating an assistant message."""
-        msg = ApiMessage(role=MessageRole.ASSISTANT, content="Hello, human!")
-        assert msg.role == MessageRole.ASSISTANT
-        assert msg.content == "Hello, human!"
+    @pytest.mark.parametrize(
+        "role,content",
+        [
+            pytest.param(MessageRole.USER, "Hello, AI!", id="user"),
+            pytest.param(MessageRole.ASSISTANT, "Hello, human!", id="assistant"),
+            pytest.param(MessageRole.SYSTEM, "You are a helpful assistant.", id="system"),
+        ],
+    )
+    def test_create_message(self, role, content):
+        """Test creating a message for each role."""
+        msg = ApiMessage(role=role, content=content)
+        assert msg.role is role
+        assert msg.content == content
 
-    def test_create_system_message(self):
-        """Test creating a system message."""
-        msg = ApiMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant.")
-        assert msg.role == MessageRole.SYSTEM
-        assert msg.content == "You are a helpful assistant."
+    @pytest.mark.parametrize(
+        "factory,role",
+        [
+            pytest.param(ApiMessage.system, MessageRole.SYSTEM, id="system"),
+            pytest.param(ApiMessage.user, MessageRole.USER, id="user"),
+            pytest.param(ApiMessage.assistant, MessageRole.ASSISTANT, id="assistant"),
+        ],
+    )
+    def test_role_factories(self, factory, role):
+        """Test the per-role message constructors."""
+        msg = factory("content")
+        assert msg == ApiMessage(role=role, content="content")
 
     def test_message_to_dict(self):
         """Test ApiMessage.to_dict() serialization."""
@@ -58,6 +69,11 @@ class TestApiMessage:
         assert msg.role == MessageRole.ASSISTANT
         assert msg.content == "Response text"
 
+    def test_message_from_dict_unknown_role(self):
+        """Test that ApiMessage.from_dict() rejects unknown roles."""
+        with pytest.raises(ValueError):
+            ApiMessage.from_dict({"role": "narrator", "content": "Once upon a time"})
+
     def test_message_round_trip(self):
         """Test that message survives to_dict -> from_dict round trip."""
         original = ApiMessage(role=MessageRole.USER, content="Original content")
@@ -103,17 +119,22 @@ class TestTokenUsage:
             "total_tokens": 15,
         }
 
-    def test_token_usage_with_zero_values(self):
-        """Test TokenUsage with zero token counts."""
-        usage = TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
-        assert usage.prompt_tokens == 0
-        assert usage.total_tokens == 0
-
-    def test_token_usage_with_large_values(self):
-        """Test TokenUsage with large token counts."""
-        usage = TokenUsage(prompt_tokens=100000, completion_tokens=50000, total_tokens=150000)
-        assert usage.prompt_tokens == 100000
-        assert usage.total_tokens == 150000
+    @pytest.mark.parametrize(
+        "prompt_tokens,completion_tokens,total_tokens",
+        [
+            pytest.param(0, 0, 0, id="zero"),
+            pytest.param(100000, 50000, 150000, id="large"),
+        ],
+    )
+    def test_token_usage_extreme_values(self, prompt_tokens, completion_tokens, total_tokens):
+        """Test TokenUsage with zero and large token counts."""
+        usage = TokenUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+        )
+        assert usage.prompt_tokens == prompt_tokens
+        assert usage.total_tokens == total_tokens
 
 
 class TestApiRequest:
@@ -121,7 +142,7 @@ class TestApiRequest:
 
     def test_create_basic_request(self):
         """Test creating a basic API request."""
-        messages = [ApiMessage(role=MessageRole.USER, content="Hello")]
+        messages = [ApiMessage.user("Hello")]
         request = ApiRequest(messages=messages)
         assert request.messages == messages
         assert request.model is None
@@ -133,7 +154,7 @@ class TestApiRequest:
         """Test creating a request with all parameters."""
         messages = [
             ApiMessage(role=MessageRole.SYSTEM, content="Be helpful"),
-            ApiMessage(role=MessageRole.USER, content="Hello"),
+            ApiMessage.user("Hello"),
         ]
         request = ApiRequest(
             messages=messages,
@@ -148,12 +169,22 @@ class TestApiRequest:
         assert request.max_tokens == 2000
         assert request.stream is True
 
+    def test_messages_as_dicts(self):
+        """Test converting request messages to dictionaries."""
+        messages = [
+            ApiMessage(role=MessageRole.SYSTEM, content="Be helpful"),
+            ApiMessage(role=MessageRole.USER, content="Hello", name="alice"),
+        ]
+        request = ApiRequest(messages=messages)
+        assert request.messages_as_dicts() == [message.to_dict() for message in messages]
+        assert ApiRequest(messages=[]).messages_as_dicts() == []
+
     def test_request_with_multiple_messages(self):
         """Test request with conversation history."""
         messages = [
-            ApiMessage(role=MessageRole.USER, content="Hello"),
+            ApiMessage.user("Hello"),
             ApiMessage(role=MessageRole.ASSISTANT, content="Hi there!"),
-            ApiMessage(role=MessageRole.USER, content="How are you?"),
+            ApiMessage.user("How are you?"),
         ]
         request = ApiRequest(messages=messages)
         assert len(request.messages) == 3
@@ -256,8 +287,8 @@ class TestIntegration:
         """Test a complete request-response workflow."""
         # Build request
         messages = [
-            ApiMessage(role=MessageRole.SYSTEM, content="You are helpful"),
-            ApiMessage(role=MessageRole.USER, content="What is 2+2?"),
+            ApiMessage.system("You are helpful"),
+            ApiMessage.user("What is 2+2?"),
         ]
         request = ApiRequest(messages=messages, model="gpt-4", temperature=0.0, stream=False)
 
@@ -277,13 +308,13 @@ class TestIntegration:
         conversation = []
 
         # First turn
-        user_msg1 = ApiMessage(role=MessageRole.USER, content="Hello")
-        assistant_msg1 = ApiMessage(role=MessageRole.ASSISTANT, content="Hi!")
+        user_msg1 = ApiMessage.user("Hello")
+        assistant_msg1 = ApiMessage.assistant("Hi!")
         conversation.extend([user_msg1, assistant_msg1])
 
         # Second turn
-        user_msg2 = ApiMessage(role=MessageRole.USER, content="How are you?")
-        assistant_msg2 = ApiMessage(role=MessageRole.ASSISTANT, content="Great!")
+        user_msg2 = ApiMessage.user("How are you?")
+        assistant_msg2 = ApiMessage.assistant("Great!")
         conversation.extend([user_msg2, assistant_msg2])
 
         # Create request with full history
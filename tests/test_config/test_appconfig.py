@@ -0,0 +1,171 @@
+"""Tests for the AppConfig configuration dataclass."""
+
+from vibe_coder.types.config import AIProvider, AppConfig
+
+
+class TestAppConfig:
+    """Test suite for AppConfig dataclass."""
+
+    def test_create_default_config(self):
+        """Test creating AppConfig with defaults."""
+        config = AppConfig(current_provider="")
+        assert config.current_provider == ""
+        assert config.providers == {}
+        assert config.default_model is None
+        assert config.default_temperature == 0.7
+        assert config.offline_mode is False
+        assert config.debug_mode is False
+
+    def test_set_and_get_provider(self):
+        """Test setting and getting providers."""
+        config = AppConfig(current_provider="test")
+        provider = AIProvider(
+            name="test",
+            api_key="sk-test",
+            endpoint="https://api.openai.com/v1",
+        )
+        config.set_provider("test", provider)
+        retrieved = config.get_provider("test")
+        assert retrieved is not None
+        assert retrieved.name == "test"
+
+    def test_get_current_provider(self):
+        """Test getting the current provider."""
+        provider = AIProvider(
+            name="current",
+            api_key="sk-test",
+            endpoint="https://api.openai.com/v1",
+        )
+        config = AppConfig(current_provider="current")
+        config.set_provider("current", provider)
+        current = config.get_provider()
+        assert current is not None
+        assert current.name == "current"
+
+    def test_get_nonexistent_provider(self):
+        """Test getting a provider that doesn't exist returns None."""
+        config = AppConfig(current_provider="")
+        result = config.get_provider("nonexistent")
+        assert result is None
+
+    def test_list_providers(self):
+        """Test listing all configured providers."""
+        provider1 = AIProvider(name="p1", api_key="sk-1", endpoint="https://api1.com")
+        provider2 = AIProvider(name="p2", api_key="sk-2", endpoint="https://api2.com")
+        config = AppConfig(current_provider="", providers={"p1": provider1, "p2": provider2})
+
+        assert config.list_providers() == ["p1", "p2"]
+
+    def test_list_providers_empty(self):
+        """Test listing providers when none are configured."""
+        config = AppConfig(current_provider="")
+        assert config.list_providers() == []
+
+    def test_delete_provider(self):
+        """Test deleting a provider."""
+        provider = AIProvider(name="to-delete", api_key="sk-test", endpoint="https://api.com")
+        config = AppConfig(current_provider="to-delete", providers={"to-delete": provider})
+        assert config.has_provider("to-delete")
+
+        config.delete_provider("to-delete")
+        assert not config.has_provider("to-delete")
+
+    def test_delete_current_provider_clears_current(self):
+        """Test that deleting current provider clears current_provider."""
+        provider = AIProvider(name="current", api_key="sk-test", endpoint="https://api.com")
+        config = AppConfig(current_provider="current", providers={"current": provider})
+        config.delete_provider("current")
+        assert config.current_provider == ""
+
+    def test_delete_non_current_provider(self):
+        """Test deleting a non-current provider doesn't affect current."""
+        provider1 = AIProvider(name="p1", api_key="sk-1", endpoint="https://api1.com")
+        provider2 = AIProvider(name="p2", api_key="sk-2", endpoint="https://api2.com")
+        config = AppConfig(current_provider="p1", providers={"p1": provider1, "p2": provider2})
+
+        config.delete_provider("p2")
+        assert config.current_provider == "p1"
+        assert config.has_provider("p1")
+        assert not config.has_provider("p2")
+
+    def test_has_provider(self):
+        """Test checking if a provider exists."""
+        provider = AIProvider(name="exists", api_key="sk-test", endpoint="https://api.com")
+        config = AppConfig(current_provider="", providers={"exists": provider})
+
+        assert config.has_provider("exists") is True
+        assert config.has_provider("missing") is False
+
+    def test_config_to_dict(self):
+        """Test AppConfig.to_dict() serialization."""
+        provider = AIProvider(
+            name="test",
+            api_key="sk-test",
+            endpoint="https://api.openai.com/v1",
+            model="gpt-4",
+        )
+        config = AppConfig(
+            current_provider="test",
+            default_model="gpt-3.5-turbo",
+            default_temperature=0.8,
+            default_max_tokens=1000,
+            offline_mode=True,
+            debug_mode=False,
+            providers={"test": provider},
+        )
+
+        result = config.to_dict()
+        assert result["current_provider"] == "test"
+        assert result["default_model"] == "gpt-3.5-turbo"
+        assert result["default_temperature"] == 0.8
+        assert result["default_max_tokens"] == 1000
+        assert result["offline_mode"] is True
+        assert result["debug_mode"] is False
+        assert "test" in result["providers"]
+
+    def test_config_from_dict(self):
+        """Test AppConfig.from_dict() deserialization."""
+        data = {
+            "current_provider": "test",
+            "providers": {
+                "test": {
+                    "name": "test",
+                    "api_key": "sk-test",
+                    "endpoint": "https://api.openai.com/v1",
+                    "model": "gpt-4",
+                    "temperature": 0.7,
+                    "max_tokens": None,
+                    "headers": None,
+                }
+            },
+            "default_model": "gpt-4",
+            "default_temperature": 0.8,
+            "default_max_tokens": 1000,
+            "offline_mode": False,
+            "debug_mode": True,
+        }
+        config = AppConfig.from_dict(data)
+        assert config.current_provider == "test"
+        assert config.has_provider("test")
+        assert config.default_model == "gpt-4"
+        assert config.default_temperature == 0.8
+        assert config.debug_mode is True
+
+    def test_config_round_trip(self):
+        """Test that config survives to_dict -> from_dict round trip."""
+        provider = AIProvider(
+            name="test",
+            api_key="sk-test",
+            endpoint="https://api.openai.com/v1",
+            temperature=0.9,
+        )
+        original = AppConfig(current_provider="test", providers={"test": provider})
+
+        assert AppConfig.from_dict(original.to_dict()) == original
+
+    def test_config_default(self):
+        """Test AppConfig.default() factory method."""
+        config = AppConfig.default()
+        assert config.current_provider == ""
+        assert config.providers == {}
+        assert config.offline_mode is False
@@ -0,0 +1,34 @@
+"""Tests for configuration enums."""
+
+from vibe_coder.types.config import InteractionMode, ProviderType
+
+
+class TestEnums:
+    """Test suite for configuration enums."""
+
+    def test_interaction_mode_values(self):
+        """Test that InteractionMode enum has correct values."""
+        assert InteractionMode.CODE.value == "code"
+        assert InteractionMode.ARCHITECT.value == "architect"
+        assert InteractionMode.ASK.value == "ask"
+        assert InteractionMode.AUDIT.value == "audit"
+
+    def test_provider_type_values(self):
+        """Test that ProviderType enum has correct values."""
+        assert ProviderType.OPENAI.value == "openai"
+        assert ProviderType.ANTHROPIC.value == "anthropic"
+        assert ProviderType.OLLAMA.value == "ollama"
+        assert ProviderType.LM_STUDIO.value == "lm-studio"
+        assert ProviderType.VLLM.value == "vllm"
+        assert ProviderType.LOCAL_AI.value == "local-ai"
+        assert ProviderType.GENERIC.value == "generic"
+
+    def test_interaction_mode_by_value(self):
+        """Test that InteractionMode can be looked up by value."""
+        mode = InteractionMode("code")
+        assert mode == InteractionMode.CODE
+
+    def test_provider_type_by_value(self):
+        """Test that ProviderType can be looked up by value."""
+        provider = ProviderType("anthropic")
+        assert provider == ProviderType.ANTHROPIC
@@ -1,94 +1,135 @@
 """Tests for ConfigManager class."""
 
 import json
-import tempfile
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from vibe_coder.config import manager as manager_module
 from vibe_coder.config.manager import ConfigManager
-from vibe_coder.types.config import AIProvider, AppConfig
+from vibe_coder.types.config import AIProvider, AppConfig, MCPServer
+
+
+@pytest.fixture
+def temp_manager(tmp_path):
+    """Fixture providing a ConfigManager with temp directory."""
+    return ConfigManager(config_dir=tmp_path)
+
+
+@pytest.fixture(scope="module")
+def readonly_manager(tmp_path_factory):
+    """ConfigManager shared by tests that only read from a fresh config."""
+    manager = ConfigManager(config_dir=tmp_path_factory.mktemp("cfg_ro"))
+    yield manager
+    # Catch tests that mutate the shared manager
+    assert manager.get_config() == AppConfig.default()
 
 
 class TestConfigManagerInitialization:
     """Test ConfigManager initialization."""
 
-    def test_create_with_default_directory(self):
+    def test_create_with_default_directory(self, tmp_path):
         """Test that ConfigManager creates default ~/.vibe directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
-            assert manager.config_dir == Path(tmpdir)
-            assert manager.config_file == Path(tmpdir) / "config.json"
+        manager = ConfigManager(config_dir=tmp_path)
+        assert manager.config_dir == tmp_path
+        assert manager.config_file == tmp_path / "config.json"
 
-    def test_creates_config_directory(self):
+    def test_creates_config_directory(self, tmp_path):
         """Test that ConfigManager creates config directory if missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / "nested" / "vibe"
-            ConfigManager(config_dir=config_dir)
-            assert config_dir.exists()
-            assert config_dir.is_dir()
+        config_dir = tmp_path / "nested" / "vibe"
+        ConfigManager(config_dir=config_dir)
+        assert config_dir.exists()
+        assert config_dir.is_dir()
 
-    def test_creates_default_config_file(self):
+    def test_creates_default_config_file(self, tmp_path):
         """Test that ConfigManager creates default config.json."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            ConfigManager(config_dir=Path(tmpdir))
-            config_file = Path(tmpdir) / "config.json"
-            assert config_file.exists()
+        ConfigManager(config_dir=tmp_path)
+        config_file = tmp_path / "config.json"
+        assert config_file.exists()
 
-    def test_loads_existing_config(self):
+    def test_loads_existing_config(self, tmp_path):
         """Test that ConfigManager loads existing config.json."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create initial config
-            config_file = Path(tmpdir) / "config.json"
-            initial_config = {
-                "current_provider": "existing",
-                "providers": {
-                    "existing": {
-                        "name": "existing",
-                        "api_key": "sk-test",
-                        "endpoint": "https://api.com",
-                        "model": None,
-                        "temperature": 0.7,
-                        "max_tokens": None,
-                        "headers": None,
-                    }
-                },
-                "default_model": None,
-                "default_temperature": 0.7,
-                "default_max_tokens": None,
-                "offline_mode": False,
-                "debug_mode": False,
-            }
-            with open(config_file, "w") as f:
-                json.dump(initial_config, f)
-
-            # Load it
-            manager = ConfigManager(config_dir=Path(tmpdir))
-            assert manager.get_current_provider() is not None
-            assert manager.get_current_provider().name == "existing"
-
-    def test_handles_corrupted_config(self):
+        # Create initial config
+        config_file = tmp_path / "config.json"
+        initial_config = {
+            "current_provider": "existing",
+            "providers": {
+                "existing": {
+                    "name": "existing",
+                    "api_key": "sk-test",
+                    "endpoint": "https://api.com",
+                    "model": None,
+                    "temperature": 0.7,
+                    "max_tokens": None,
+                    "headers": None,
+                }
+            },
+            "default_model": None,
+            "default_temperature": 0.7,
+            "default_max_tokens": None,
+            "offline_mode": False,
+            "debug_mode": False,
+        }
+        config_file.write_text(json.dumps(initial_config))
+
+        # Load it
+        manager = ConfigManager(config_dir=tmp_path)
+        assert manager.get_current_provider() is not None
+        assert manager.get_current_provider().name == "existing"
+
+    def test_existing_config_not_rewritten(self, tmp_path):
+        """Test that constructing over an existing config.json does not rewrite it."""
+        ConfigManager(config_dir=tmp_path)
+        config_file = tmp_path / "config.json"
+        before = config_file.stat().st_mtime_ns
+
+        with patch.object(ConfigManager, "_write_config") as mock_write:
+            manager = ConfigManager(config_dir=tmp_path)
+            manager.list_providers()
+            mock_write.assert_not_called()
+        assert config_file.stat().st_mtime_ns == before
+
+    def test_existing_config_loaded_on_first_use(self, tmp_path):
+        """Test that an existing config.json is only parsed when first needed."""
+        ConfigManager(config_dir=tmp_path)
+
+        with patch.object(
+            ConfigManager, "_load_config", autospec=True, return_value=AppConfig.default()
+        ) as mock_load:
+            manager = ConfigManager(config_dir=tmp_path)
+            mock_load.assert_not_called()
+
+            manager.list_providers()
+            manager.list_providers()
+            mock_load.assert_called_once_with(manager)
+
+    def test_handles_corrupted_config(self, tmp_path):
         """Test that ConfigManager handles corrupted config.json gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create corrupted config
-            config_file = Path(tmpdir) / "config.json"
-            with open(config_file, "w") as f:
-                f.write("{ invalid json }")
+        # Create corrupted config
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{ invalid json }")
 
-            # Should return default config instead of crashing
-            manager = ConfigManager(config_dir=Path(tmpdir))
-            assert manager.list_providers() == []
+        # Should return default config instead of crashing
+        manager = ConfigManager(config_dir=tmp_path)
+        assert manager.list_providers() == []
+
+    def test_works_without_orjson(self, tmp_path, monkeypatch):
+        """Test that config round-trips through the stdlib json fallback."""
+        monkeypatch.setattr(manager_module, "orjson", None)
+        manager = ConfigManager(config_dir=tmp_path)
+        provider = AIProvider(name="fallback", api_key="sk-test", endpoint="https://api.com")
+        manager.set_provider("fallback", provider)
+
+        manager2 = ConfigManager(config_dir=tmp_path)
+        assert manager2.get_provider("fallback") == provider
+
+        (tmp_path / "config.json").write_text("{ invalid json }")
+        assert ConfigManager(config_dir=tmp_path).list_providers() == []
 
 
 class TestConfigManagerProviderOperations:
     """Test provider CRUD operations."""
 
-    @pytest.fixture
-    def temp_manager(self):
-        """Fixture providing a ConfigManager with temp directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield ConfigManager(config_dir=Path(tmpdir))
-
     def test_set_and_get_provider(self, temp_manager):
         """Test setting and retrieving a provider."""
         provider = AIProvider(
@@ -104,9 +145,9 @@ class TestConfigManagerProviderOperations:
         assert retrieved.name == "test"
         assert retrieved.model == "gpt-4"
 
-    def test_get_nonexistent_provider(self, temp_manager):
+    def test_get_nonexistent_provider(self, readonly_manager):
         """Test getting a provider that doesn't exist returns None."""
-        result = temp_manager.get_provider("nonexistent")
+        result = readonly_manager.get_provider("nonexistent")
         assert result is None
 
     def test_set_provider_persists_to_disk(self, temp_manager):
@@ -120,8 +161,7 @@ class TestConfigManagerProviderOperations:
 
         # Read file directly to verify
         config_file = temp_manager.config_file
-        with open(config_file, "r") as f:
-            data = json.load(f)
+        data = json.loads(config_file.read_bytes())
         assert "persist-test" in data["providers"]
         assert data["providers"]["persist-test"]["name"] == "persist-test"
 
@@ -139,19 +179,33 @@ class TestConfigManagerProviderOperations:
         assert current is not None
         assert current.name == "current"
 
+    def test_set_provider_as_current_saves_once(self, temp_manager):
+        """Test that set_provider(current=True) stores and selects in one save."""
+        provider = AIProvider(name="chosen", api_key="sk-test", endpoint="https://api.com")
+
+        with patch.object(
+            temp_manager, "_write_config", wraps=temp_manager._write_config
+        ) as mock_write:
+            temp_manager.set_provider("chosen", provider, current=True)
+            mock_write.assert_called_once()
+
+        manager2 = ConfigManager(config_dir=temp_manager.config_dir)
+        assert manager2.get_current_provider_name() == "chosen"
+        assert manager2.get_current_provider() == provider
+
     def test_set_current_provider_nonexistent_raises_error(self, temp_manager):
         """Test that setting nonexistent provider as current raises error."""
         with pytest.raises(ValueError, match="not found"):
             temp_manager.set_current_provider("nonexistent")
 
-    def test_get_current_provider_none_initially(self, temp_manager):
+    def test_get_current_provider_none_initially(self, readonly_manager):
         """Test that current provider is None initially."""
-        current = temp_manager.get_current_provider()
+        current = readonly_manager.get_current_provider()
         assert current is None
 
-    def test_list_providers_empty(self, temp_manager):
+    def test_list_providers_empty(self, readonly_manager):
         """Test listing providers when none exist."""
-        providers = temp_manager.list_providers()
+        providers = readonly_manager.list_providers()
         assert providers == []
 
     def test_list_providers_multiple(self, temp_manager):
@@ -163,8 +217,8 @@ class TestConfigManagerProviderOperations:
         temp_manager.set_provider("p2", provider2)
         temp_manager.set_provider("p3", provider3)
 
-        providers = temp_manager.list_providers()
-        assert set(providers) == {"p1", "p2", "p3"}
+        # Providers are listed in the order they were added
+        assert temp_manager.list_providers() == ["p1", "p2", "p3"]
 
     def test_has_provider(self, temp_manager):
         """Test checking provider existence."""
@@ -190,8 +244,7 @@ class TestConfigManagerProviderOperations:
         temp_manager.delete_provider("delete-persist")
 
         # Read file directly
-        with open(temp_manager.config_file, "r") as f:
-            data = json.load(f)
+        data = json.loads(temp_manager.config_file.read_bytes())
         assert "delete-persist" not in data["providers"]
 
     def test_delete_current_provider_clears_current(self, temp_manager):
@@ -212,18 +265,23 @@ class TestConfigManagerProviderOperations:
 class TestConfigManagerConfigOperations:
     """Test overall config operations."""
 
-    @pytest.fixture
-    def temp_manager(self):
-        """Fixture providing a ConfigManager with temp directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield ConfigManager(config_dir=Path(tmpdir))
-
-    def test_get_config(self, temp_manager):
+    def test_get_config(self, readonly_manager):
         """Test getting the AppConfig object."""
-        config = temp_manager.get_config()
+        config = readonly_manager.get_config()
         assert isinstance(config, AppConfig)
         assert config.current_provider == ""
 
+    def test_get_config_returns_live_config(self, temp_manager):
+        """Test that get_config() returns the same object, kept up to date."""
+        config = temp_manager.get_config()
+        assert temp_manager.get_config() is config
+
+        provider = AIProvider(name="live", api_key="sk-test", endpoint="https://api.com")
+        temp_manager.set_provider("live", provider)
+        temp_manager.set_current_provider("live")
+        assert config.providers["live"] is provider
+        assert config.current_provider == "live"
+
     def test_set_config(self, temp_manager):
         """Test replacing the entire config."""
         new_config = AppConfig(current_provider="new")
@@ -278,102 +336,173 @@ class TestConfigManagerConfigOperations:
         manager2 = ConfigManager(config_dir=temp_manager.config_dir)
         assert manager2.get_config().debug_mode is True
 
+    @pytest.mark.parametrize("persist", ["set_provider", "save_config"])
+    def test_in_place_provider_edit_persists(self, temp_manager, persist):
+        """Test that editing a stored provider in place is not hidden by the cache."""
+        provider = AIProvider(name="edited", api_key="sk-test", endpoint="https://api.com")
+        temp_manager.set_provider("edited", provider)
+
+        provider.model = "new-model"
+        if persist == "set_provider":
+            temp_manager.set_provider("edited", provider)
+        else:
+            temp_manager.save_config()
+
+        manager2 = ConfigManager(config_dir=temp_manager.config_dir)
+        assert manager2.get_provider("edited").model == "new-model"
+
+    @pytest.mark.parametrize("save", ["set_current_provider", "set_mcp_server", "delete_provider"])
+    def test_in_place_provider_edit_saved_by_other_mutations(self, temp_manager, save):
+        """Test that any later save writes the provider's current fields."""
+        for name in ("a", "b"):
+            temp_manager.set_provider(
+                name, AIProvider(name=name, api_key="sk-test", endpoint="https://api.com")
+            )
+
+        temp_manager.get_provider("a").model = "changed"
+        if save == "set_current_provider":
+            temp_manager.set_current_provider("b")
+        elif save == "set_mcp_server":
+            temp_manager.set_mcp_server("fs", MCPServer(name="fs", command="mcp-fs"))
+        else:
+            temp_manager.delete_provider("b")
+
+        manager2 = ConfigManager(config_dir=temp_manager.config_dir)
+        assert manager2.get_provider("a").model == "changed"
+
+    def test_interrupted_save_keeps_previous_file(self, temp_manager):
+        """Test that a save failing before the rename leaves config.json intact."""
+        provider = AIProvider(name="kept", api_key="sk-test", endpoint="https://api.com")
+        temp_manager.set_provider("kept", provider)
+        before = temp_manager.config_file.read_bytes()
+
+        with patch("vibe_coder.config.manager.os.replace", side_effect=OSError("killed")):
+            with pytest.raises(OSError):
+                temp_manager.delete_provider("kept")
+
+        assert temp_manager.config_file.read_bytes() == before
+        assert list(temp_manager.config_dir.iterdir()) == [temp_manager.config_file]
+
+    def test_batch_updates_write_once_on_exit(self, temp_manager):
+        """Test that batched mutations are written together when the block exits."""
+        provider = AIProvider(name="batched", api_key="sk-test", endpoint="https://api.com")
+
+        with patch.object(
+            temp_manager, "_write_config", wraps=temp_manager._write_config
+        ) as mock_write:
+            with temp_manager.batch_updates():
+                temp_manager.set_provider("batched", provider)
+                with temp_manager.batch_updates():
+                    temp_manager.set_current_provider("batched")
+                assert mock_write.call_count == 0
+            assert mock_write.call_count == 1
+
+        manager2 = ConfigManager(config_dir=temp_manager.config_dir)
+        assert manager2.get_current_provider_name() == "batched"
+
+    def test_batch_updates_not_saved_when_block_raises(self, temp_manager):
+        """Test that a batch that raises is not written and its error propagates."""
+        provider = AIProvider(name="partial", api_key="sk-test", endpoint="https://api.com")
+
+        with patch.object(
+            temp_manager, "_write_config", wraps=temp_manager._write_config
+        ) as mock_write:
+            with pytest.raises(ValueError, match="missing"):
+                with temp_manager.batch_updates():
+                    temp_manager.set_provider("partial", provider)
+                    temp_manager.set_current_provider("missing")
+            mock_write.assert_not_called()
+
+        assert temp_manager._dirty is False
+        manager2 = ConfigManager(config_dir=temp_manager.config_dir)
+        assert not manager2.has_provider("partial")
+
 
 class TestConfigManagerPersistence:
     """Test configuration persistence across instances."""
 
-    def test_persistence_across_instances(self):
+    def test_persistence_across_instances(self, tmp_path):
         """Test that configuration persists across manager instances."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create and populate first manager
-            manager1 = ConfigManager(config_dir=Path(tmpdir))
-            provider = AIProvider(
-                name="persistent",
-                api_key="sk-persist",
-                endpoint="https://api.openai.com/v1",
-                model="gpt-4",
-                temperature=0.8,
-            )
-            manager1.set_provider("persistent", provider)
-            manager1.set_current_provider("persistent")
+        # Create and populate first manager
+        manager1 = ConfigManager(config_dir=tmp_path)
+        provider = AIProvider(
+            name="persistent",
+            api_key="sk-persist",
+            endpoint="https://api.openai.com/v1",
+            model="gpt-4",
+            temperature=0.8,
+        )
+        manager1.set_provider("persistent", provider)
+        manager1.set_current_provider("persistent")
 
-            # Create new manager with same directory
-            manager2 = ConfigManager(config_dir=Path(tmpdir))
+        # Create new manager with same directory
+        manager2 = ConfigManager(config_dir=tmp_path)
 
-            # Verify data persisted
-            assert manager2.has_provider("persistent")
-            current = manager2.get_current_provider()
-            assert current is not None
-            assert current.name == "persistent"
-            assert current.model == "gpt-4"
-            assert current.temperature == 0.8
+        # Verify data persisted
+        assert manager2.has_provider("persistent")
+        current = manager2.get_current_provider()
+        assert current is not None
+        assert current.name == "persistent"
+        assert current.model == "gpt-4"
+        assert current.temperature == 0.8
 
-    def test_multiple_providers_persistence(self):
+    def test_multiple_providers_persistence(self, tmp_path):
         """Test persistence of multiple providers."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager1 = ConfigManager(config_dir=Path(tmpdir))
-
-            # Add multiple providers
-            for i in range(1, 4):
-                provider = AIProvider(
-                    name=f"provider-{i}",
-                    api_key=f"sk-{i}",
-                    endpoint=f"https://api{i}.com",
-                )
-                manager1.set_provider(f"provider-{i}", provider)
-
-            # Create new manager and verify all persisted
-            manager2 = ConfigManager(config_dir=Path(tmpdir))
-            providers = manager2.list_providers()
-            assert len(providers) == 3
-            assert all(p in providers for p in ["provider-1", "provider-2", "provider-3"])
-
-    def test_config_file_format(self):
-        """Test that config.json has expected format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
+        manager1 = ConfigManager(config_dir=tmp_path)
+
+        # Add multiple providers
+        for i in range(1, 4):
             provider = AIProvider(
-                name="format-test",
-                api_key="sk-format",
-                endpoint="https://api.com",
-                model="model-x",
-                temperature=0.5,
-                max_tokens=1000,
+                name=f"provider-{i}",
+                api_key=f"sk-{i}",
+                endpoint=f"https://api{i}.com",
             )
-            manager.set_provider("format-test", provider)
-            manager.set_current_provider("format-test")
-
-            # Read and check format
-            config_file = Path(tmpdir) / "config.json"
-            with open(config_file, "r") as f:
-                data = json.load(f)
-
-            # Verify structure
-            assert "current_provider" in data
-            assert "providers" in data
-            assert "default_model" in data
-            assert "default_temperature" in data
-            assert "offline_mode" in data
-            assert "debug_mode" in data
-
-            # Verify provider structure
-            provider_data = data["providers"]["format-test"]
-            assert provider_data["name"] == "format-test"
-            assert provider_data["api_key"] == "sk-format"
-            assert provider_data["model"] == "model-x"
-            assert provider_data["temperature"] == 0.5
-            assert provider_data["max_tokens"] == 1000
+            manager1.set_provider(f"provider-{i}", provider)
+
+        # Create new manager and verify all persisted
+        manager2 = ConfigManager(config_dir=tmp_path)
+        providers = manager2.list_providers()
+        assert len(providers) == 3
+        assert all(p in providers for p in ["provider-1", "provider-2", "provider-3"])
+
+    def test_config_file_format(self, tmp_path):
+        """Test that config.json has expected format."""
+        manager = ConfigManager(config_dir=tmp_path)
+        provider = AIProvider(
+            name="format-test",
+            api_key="sk-format",
+            endpoint="https://api.com",
+            model="model-x",
+            temperature=0.5,
+            max_tokens=1000,
+        )
+        manager.set_provider("format-test", provider)
+        manager.set_current_provider("format-test")
+
+        # Read and check format
+        config_file = tmp_path / "config.json"
+        data = json.loads(config_file.read_bytes())
+
+        # Verify structure
+        assert "current_provider" in data
+        assert "providers" in data
+        assert "default_model" in data
+        assert "default_temperature" in data
+        assert "offline_mode" in data
+        assert "debug_mode" in data
+
+        # Verify provider structure
+        provider_data = data["providers"]["format-test"]
+        assert provider_data["name"] == "format-test"
+        assert provider_data["api_key"] == "sk-format"
+        assert provider_data["model"] == "model-x"
+        assert provider_data["temperature"] == 0.5
+        assert provider_data["max_tokens"] == 1000
 
 
 class TestConfigManagerEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    def temp_manager(self):
-        """Fixture providing a ConfigManager with temp directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield ConfigManager(config_dir=Path(tmpdir))
-
     def test_provider_with_none_fields(self, temp_manager):
         """Test handling provider with None optional fields."""
         provider = AIProvider(
@@ -411,6 +540,59 @@ class TestConfigManagerEdgeCases:
         temp_manager.delete_provider("does-not-exist")
         assert not temp_manager.has_provider("does-not-exist")
 
+    def test_no_op_mutations_skip_save(self, temp_manager):
+        """Test that mutations which change nothing do not rewrite config.json."""
+        provider = AIProvider(name="same", api_key="sk-test", endpoint="https://api.com")
+        temp_manager.set_provider("same", provider)
+        temp_manager.set_current_provider("same")
+
+        with patch.object(temp_manager, "_write_config") as mock_write:
+            temp_manager.delete_provider("does-not-exist")
+            temp_manager.set_provider(
+                "same", AIProvider(name="same", api_key="sk-test", endpoint="https://api.com")
+            )
+            temp_manager.set_current_provider("same")
+            mock_write.assert_not_called()
+
+            temp_manager.set_provider(
+                "same", AIProvider(name="same", api_key="sk-new", endpoint="https://api.com")
+            )
+            mock_write.assert_called_once()
+
+    def test_no_op_guard_retries_failed_save(self, temp_manager):
+        """Test that a repeated mutation is saved again if the previous save failed."""
+        provider = AIProvider(name="retry", api_key="sk-test", endpoint="https://api.com")
+
+        with patch("vibe_coder.config.manager.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                temp_manager.set_provider("retry", provider)
+
+        temp_manager.set_provider("retry", provider)
+        manager2 = ConfigManager(config_dir=temp_manager.config_dir)
+        assert manager2.has_provider("retry")
+
+    def test_save_skipped_when_file_already_matches(self, temp_manager):
+        """Test that saving identical bytes leaves config.json untouched."""
+        temp_manager.save_config()
+        before = temp_manager.config_file.stat().st_mtime_ns
+
+        with patch("vibe_coder.config.manager.os.replace") as mock_replace:
+            temp_manager.save_config()
+            mock_replace.assert_not_called()
+        assert temp_manager.config_file.stat().st_mtime_ns == before
+
+    def test_save_rewrites_file_changed_elsewhere(self, temp_manager):
+        """Test that an externally edited or deleted config.json is rewritten."""
+        temp_manager.save_config()
+
+        temp_manager.config_file.unlink()
+        temp_manager.save_config()
+        assert temp_manager.config_file.exists()
+
+        temp_manager.config_file.write_text("{}")
+        temp_manager.save_config()
+        assert json.loads(temp_manager.config_file.read_bytes()) == AppConfig.default().to_dict()
+
     def test_provider_name_case_sensitive(self, temp_manager):
         """Test that provider names are case-sensitive."""
         provider = AIProvider(
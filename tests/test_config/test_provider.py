@@ -0,0 +1,117 @@
+"""Tests for the AIProvider configuration dataclass."""
+
+import re
+
+import pytest
+
+from vibe_coder.types.config import AIProvider
+
+_TEMP_RE = re.compile("Temperature must be between")
+_MAX_TOK_RE = re.compile("max_tokens must be positive")
+
+
+class TestAIProvider:
+    """Test suite for AIProvider dataclass."""
+
+    def test_create_provider_with_valid_values(self, provider_factory):
+        """Test creating an AIProvider with valid values."""
+        provider = provider_factory(
+            name="test-openai",
+            model="gpt-4",
+            temperature=0.7,
+            max_tokens=2000,
+        )
+        assert provider.name == "test-openai"
+        assert provider.api_key == "sk-test-key-1234567890"
+        assert provider.endpoint == "https://api.openai.com/v1"
+        assert provider.model == "gpt-4"
+        assert provider.temperature == 0.7
+        assert provider.max_tokens == 2000
+
+    def test_create_provider_with_minimal_values(self):
+        """Test creating an AIProvider with only required fields."""
+        provider = AIProvider(
+            name="minimal",
+            api_key="sk-minimal-key-123",
+            endpoint="https://api.example.com",
+        )
+        assert provider.name == "minimal"
+        assert provider.temperature == 0.7  # Default
+        assert provider.max_tokens is None  # Default
+        assert provider.model is None  # Default
+
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            pytest.param({"temperature": 2.1}, _TEMP_RE, id="temp_too_high"),
+            pytest.param({"temperature": -0.1}, _TEMP_RE, id="temp_too_low"),
+            pytest.param({"max_tokens": -100}, _MAX_TOK_RE, id="tokens_negative"),
+            pytest.param({"max_tokens": 0}, _MAX_TOK_RE, id="tokens_zero"),
+        ],
+    )
+    def test_invalid_values_raise(self, provider_factory, overrides, match):
+        """Test that out-of-range temperature and max_tokens raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            provider_factory(**overrides)
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            pytest.param("temperature", 0.0, id="temp_lower_bound"),
+            pytest.param("temperature", 2.0, id="temp_upper_bound"),
+            pytest.param("max_tokens", 1, id="tokens_one"),
+        ],
+    )
+    def test_boundary_values_accepted(self, provider_factory, field, value):
+        """Test that the temperature bounds and max_tokens=1 are valid."""
+        provider = provider_factory(**{field: value})
+        assert getattr(provider, field) == value
+
+    def test_provider_to_dict(self):
+        """Test AIProvider.to_dict() serialization."""
+        provider = AIProvider(
+            name="test",
+            api_key="sk-test-key",
+            endpoint="https://api.openai.com/v1",
+            model="gpt-4",
+            temperature=0.8,
+            max_tokens=1500,
+            headers={"X-Custom": "value"},
+        )
+        result = provider.to_dict()
+        assert result["name"] == "test"
+        assert result["api_key"] == "sk-test-key"
+        assert result["endpoint"] == "https://api.openai.com/v1"
+        assert result["model"] == "gpt-4"
+        assert result["temperature"] == 0.8
+        assert result["max_tokens"] == 1500
+        assert result["headers"] == {"X-Custom": "value"}
+
+    def test_provider_from_dict(self):
+        """Test AIProvider.from_dict() deserialization."""
+        data = {
+            "name": "test",
+            "api_key": "sk-test-key",
+            "endpoint": "https://api.openai.com/v1",
+            "model": "gpt-4",
+            "temperature": 0.8,
+            "max_tokens": 1500,
+            "headers": {"X-Custom": "value"},
+        }
+        provider = AIProvider.from_dict(data)
+        assert provider.name == "test"
+        assert provider.api_key == "sk-test-key"
+        assert provider.temperature == 0.8
+        assert provider.headers == {"X-Custom": "value"}
+
+    def test_provider_round_trip(self):
+        """Test that provider survives to_dict -> from_dict round trip."""
+        original = AIProvider(
+            name="round-trip",
+            api_key="sk-test-key",
+            endpoint="https://api.openai.com/v1",
+            model="gpt-4",
+            temperature=0.9,
+            max_tokens=2000,
+        )
+        assert AIProvider.from_dict(original.to_dict()) == original
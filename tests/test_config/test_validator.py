@@ -1,5 +1,9 @@
 """Tests for configuration validator functions."""
 
+from dataclasses import MISSING, fields
+
+import pytest
+
 from vibe_coder.config.validator import (
     is_localhost,
     is_valid_url,
@@ -13,235 +17,196 @@ from vibe_coder.config.validator import (
 from vibe_coder.types.config import AIProvider
 
 
-class TestValidateApiKey:
-    """Test API key validation."""
+def _err_contains(errors, needle):
+    """Return True if any error message mentions ``needle`` (case-insensitive)."""
+    return needle in "\n".join(errors).lower()
 
-    def test_valid_api_key(self):
-        """Test valid API keys."""
-        assert validate_api_key("sk-1234567890") is True
-        assert validate_api_key("sk-very-long-api-key-12345") is True
-        assert validate_api_key("test-key-minimum10") is True
 
-    def test_valid_api_key_exactly_10_chars(self):
-        """Test API key with exactly 10 characters."""
-        assert validate_api_key("1234567890") is True
+def _raw_provider(**values):
+    """
+    Build an AIProvider without running ``__post_init__``.
 
-    def test_invalid_api_key_too_short(self):
-        """Test API key shorter than 10 characters."""
-        assert validate_api_key("short") is False
-        assert validate_api_key("123456789") is False
+    Lets tests hand the validator values the constructor would reject.
+    Unspecified fields take their dataclass defaults, built fresh from any
+    ``default_factory``; fields with no default at all are empty strings.
+    """
+    provider = object.__new__(AIProvider)
+    for f in fields(AIProvider):
+        if f.name in values:
+            value = values[f.name]
+        elif f.default is not MISSING:
+            value = f.default
+        elif f.default_factory is not MISSING:
+            value = f.default_factory()
+        else:
+            value = ""
+        object.__setattr__(provider, f.name, value)
+    return provider
 
-    def test_invalid_api_key_with_spaces(self):
-        """Test API key containing spaces."""
-        assert validate_api_key("has space") is False
-        assert validate_api_key("sk-test key") is False
 
-    def test_invalid_api_key_empty(self):
-        """Test empty API key."""
-        assert validate_api_key("") is False
+class TestValidateApiKey:
+    """Test API key validation."""
 
-    def test_invalid_api_key_not_string(self):
-        """Test non-string API key."""
-        assert validate_api_key(None) is False
-        assert validate_api_key(123) is False
+    @pytest.mark.parametrize(
+        "api_key,valid",
+        [
+            pytest.param("sk-1234567890", True, id="sk_prefix"),
+            pytest.param("sk-very-long-api-key-12345", True, id="long"),
+            pytest.param("test-key-minimum10", True, id="no_prefix"),
+            pytest.param("1234567890", True, id="exactly_10_chars"),
+            pytest.param("short", False, id="too_short"),
+            pytest.param("123456789", False, id="9_chars"),
+            pytest.param("has space", False, id="space"),
+            pytest.param("sk-test key", False, id="inner_space"),
+            pytest.param("", False, id="empty"),
+            pytest.param(None, False, id="none"),
+            pytest.param(123, False, id="not_string"),
+        ],
+    )
+    def test_validate_api_key(self, api_key, valid):
+        """Test that keys need 10+ characters and no spaces."""
+        assert validate_api_key(api_key) is valid
 
 
 class TestValidateEndpoint:
     """Test endpoint URL validation."""
 
-    def test_valid_https_endpoint(self):
-        """Test valid HTTPS endpoints."""
-        assert validate_endpoint("https://api.openai.com/v1") is True
-        assert validate_endpoint("https://api.anthropic.com") is True
-        assert validate_endpoint("https://example.com:8443") is True
-
-    def test_valid_http_endpoint(self):
-        """Test valid HTTP endpoints."""
-        assert validate_endpoint("http://localhost:8000") is True
-        assert validate_endpoint("http://127.0.0.1:5000") is True
-        assert validate_endpoint("http://example.com") is True
-
-    def test_valid_endpoint_with_path(self):
-        """Test endpoints with paths."""
-        assert validate_endpoint("https://api.openai.com/v1/chat") is True
-        assert validate_endpoint("http://localhost:8000/api") is True
-
-    def test_invalid_endpoint_no_scheme(self):
-        """Test endpoint without scheme."""
-        assert validate_endpoint("api.openai.com") is False
-        assert validate_endpoint("example.com") is False
-
-    def test_invalid_endpoint_invalid_scheme(self):
-        """Test endpoint with invalid scheme."""
-        assert validate_endpoint("ftp://example.com") is False
-        assert validate_endpoint("file:///path/to/file") is False
-
-    def test_invalid_endpoint_no_domain(self):
-        """Test endpoint without domain."""
-        assert validate_endpoint("https://") is False
-        assert validate_endpoint("http://") is False
-
-    def test_invalid_endpoint_empty(self):
-        """Test empty endpoint."""
-        assert validate_endpoint("") is False
-
-    def test_invalid_endpoint_not_string(self):
-        """Test non-string endpoint."""
-        assert validate_endpoint(None) is False
-        assert validate_endpoint(123) is False
+    @pytest.mark.parametrize(
+        "endpoint,valid",
+        [
+            pytest.param("https://api.openai.com/v1", True, id="https"),
+            pytest.param("https://api.anthropic.com", True, id="https_no_path"),
+            pytest.param("https://example.com:8443", True, id="https_port"),
+            pytest.param("http://localhost:8000", True, id="http_localhost"),
+            pytest.param("http://127.0.0.1:5000", True, id="http_ip"),
+            pytest.param("http://example.com", True, id="http"),
+            pytest.param("https://api.openai.com/v1/chat", True, id="https_path"),
+            pytest.param("http://localhost:8000/api", True, id="http_path"),
+            pytest.param("api.openai.com", False, id="no_scheme"),
+            pytest.param("example.com", False, id="bare_domain"),
+            pytest.param("ftp://example.com", False, id="ftp_scheme"),
+            pytest.param("file:///path/to/file", False, id="file_scheme"),
+            pytest.param("https://", False, id="https_no_domain"),
+            pytest.param("http://", False, id="http_no_domain"),
+            pytest.param("", False, id="empty"),
+            pytest.param(None, False, id="none"),
+            pytest.param(123, False, id="not_string"),
+        ],
+    )
+    def test_validate_endpoint(self, endpoint, valid):
+        """Test that endpoints need an http(s) scheme and a host."""
+        assert validate_endpoint(endpoint) is valid
 
 
 class TestValidateTemperature:
     """Test temperature validation."""
 
-    def test_valid_temperature_default(self):
-        """Test default temperature."""
-        assert validate_temperature(0.7) is True
-
-    def test_valid_temperature_boundaries(self):
-        """Test temperature boundaries."""
-        assert validate_temperature(0.0) is True
-        assert validate_temperature(2.0) is True
-
-    def test_valid_temperature_mid_range(self):
-        """Test temperatures in valid range."""
-        assert validate_temperature(0.5) is True
-        assert validate_temperature(1.0) is True
-        assert validate_temperature(1.5) is True
-
-    def test_invalid_temperature_too_high(self):
-        """Test temperature above 2.0."""
-        assert validate_temperature(2.1) is False
-        assert validate_temperature(3.0) is False
-        assert validate_temperature(100.0) is False
-
-    def test_invalid_temperature_too_low(self):
-        """Test temperature below 0.0."""
-        assert validate_temperature(-0.1) is False
-        assert validate_temperature(-1.0) is False
-
-    def test_invalid_temperature_not_numeric(self):
-        """Test non-numeric temperature."""
-        assert validate_temperature(None) is False
-        assert validate_temperature("0.7") is False
-        assert validate_temperature([]) is False
-
-    def test_valid_temperature_as_int(self):
-        """Test temperature as integer."""
-        assert validate_temperature(0) is True
-        assert validate_temperature(1) is True
-        assert validate_temperature(2) is True
-
-    def test_invalid_temperature_as_int(self):
-        """Test invalid integer temperature."""
-        assert validate_temperature(-1) is False
-        assert validate_temperature(3) is False
+    @pytest.mark.parametrize(
+        "temperature,valid",
+        [
+            pytest.param(0.7, True, id="default"),
+            pytest.param(0.0, True, id="lower_bound"),
+            pytest.param(2.0, True, id="upper_bound"),
+            pytest.param(0.5, True, id="mid_0.5"),
+            pytest.param(1.0, True, id="mid_1.0"),
+            pytest.param(1.5, True, id="mid_1.5"),
+            pytest.param(0, True, id="int_0"),
+            pytest.param(1, True, id="int_1"),
+            pytest.param(2, True, id="int_2"),
+            pytest.param(2.1, False, id="above_2.1"),
+            pytest.param(3.0, False, id="above_3.0"),
+            pytest.param(100.0, False, id="above_100"),
+            pytest.param(-0.1, False, id="below_-0.1"),
+            pytest.param(-1.0, False, id="below_-1.0"),
+            pytest.param(-1, False, id="int_-1"),
+            pytest.param(3, False, id="int_3"),
+            pytest.param(None, False, id="none"),
+            pytest.param("0.7", False, id="string"),
+            pytest.param([], False, id="list"),
+        ],
+    )
+    def test_validate_temperature(self, temperature, valid):
+        """Test that temperature must be a number in 0.0-2.0."""
+        assert validate_temperature(temperature) is valid
 
 
 class TestValidateMaxTokens:
     """Test max_tokens validation."""
 
-    def test_valid_max_tokens(self):
-        """Test valid max_tokens."""
-        assert validate_max_tokens(1) is True
-        assert validate_max_tokens(100) is True
-        assert validate_max_tokens(4096) is True
-        assert validate_max_tokens(100000) is True
-
-    def test_invalid_max_tokens_zero(self):
-        """Test max_tokens of zero."""
-        assert validate_max_tokens(0) is False
-
-    def test_invalid_max_tokens_negative(self):
-        """Test negative max_tokens."""
-        assert validate_max_tokens(-1) is False
-        assert validate_max_tokens(-100) is False
-
-    def test_invalid_max_tokens_not_int(self):
-        """Test non-integer max_tokens."""
-        assert validate_max_tokens(None) is False
-        assert validate_max_tokens(3.14) is False
-        assert validate_max_tokens("100") is False
+    @pytest.mark.parametrize(
+        "max_tokens,valid",
+        [
+            pytest.param(1, True, id="one"),
+            pytest.param(100, True, id="100"),
+            pytest.param(4096, True, id="4096"),
+            pytest.param(100000, True, id="100000"),
+            pytest.param(0, False, id="zero"),
+            pytest.param(-1, False, id="negative_1"),
+            pytest.param(-100, False, id="negative_100"),
+            pytest.param(None, False, id="none"),
+            pytest.param(3.14, False, id="float"),
+            pytest.param("100", False, id="string"),
+        ],
+    )
+    def test_validate_max_tokens(self, max_tokens, valid):
+        """Test that max_tokens must be a positive integer."""
+        assert validate_max_tokens(max_tokens) is valid
 
 
 class TestValidateProvider:
     """Test AIProvider validation."""
 
-    def test_valid_provider_minimal(self):
+    def test_valid_provider_minimal(self, provider_factory):
         """Test validation of minimal valid provider."""
-        provider = AIProvider(
-            name="test",
-            api_key="sk-test-1234567890",
-            endpoint="https://api.com",
-        )
+        provider = provider_factory()
         errors = validate_provider(provider)
         assert len(errors) == 0
 
-    def test_valid_provider_complete(self):
+    def test_valid_provider_complete(self, provider_factory):
         """Test validation of complete valid provider."""
-        provider = AIProvider(
-            name="test",
-            api_key="sk-test-1234567890",
-            endpoint="https://api.openai.com/v1",
-            model="gpt-4",
-            temperature=0.8,
-            max_tokens=1000,
-        )
+        provider = provider_factory(model="gpt-4", temperature=0.8, max_tokens=1000)
         errors = validate_provider(provider)
         assert len(errors) == 0
 
-    def test_invalid_provider_empty_name(self):
+    def test_invalid_provider_empty_name(self, provider_factory):
         """Test provider with empty name."""
-        provider = AIProvider(
-            name="",
-            api_key="sk-test-1234567890",
-            endpoint="https://api.com",
-        )
+        provider = provider_factory(name="")
         errors = validate_provider(provider)
         assert len(errors) >= 1
-        assert any("name" in err.lower() for err in errors)
-
-    def test_invalid_provider_short_api_key(self):
-        """Test provider with short API key."""
-        try:
-            provider = AIProvider(
-                name="test",
-                api_key="short",
-                endpoint="https://api.com",
-            )
-            errors = validate_provider(provider)
-            # API key validation at __post_init__ doesn't fail on short keys
-            # but our validator will catch it
-            assert any("api key" in err.lower() for err in errors)
-        except ValueError:
-            # __post_init__ doesn't validate api_key format
-            pass
-
-    def test_invalid_provider_bad_endpoint(self):
+        assert _err_contains(errors, "name")
+
+    def test_invalid_provider_short_api_key(self, provider_factory):
+        """Test that a short API key is left to the validator to report."""
+        errors = validate_provider(provider_factory(api_key="short"))
+        assert _err_contains(errors, "api key")
+
+    def test_invalid_provider_bad_endpoint(self, provider_factory):
         """Test provider with invalid endpoint."""
-        provider = AIProvider(
-            name="test",
-            api_key="sk-test-1234567890",
-            endpoint="not-a-url",
-        )
+        provider = provider_factory(endpoint="not-a-url")
         errors = validate_provider(provider)
         assert len(errors) >= 1
-        assert any("endpoint" in err.lower() or "url" in err.lower() for err in errors)
-
-    def test_invalid_provider_invalid_max_tokens(self):
-        """Test provider with invalid max_tokens."""
-        try:
-            AIProvider(
-                name="test",
-                api_key="sk-test-1234567890",
-                endpoint="https://api.com",
-                max_tokens=-100,
-            )
-            # __post_init__ should have caught this
-            assert False, "Should have raised ValueError"
-        except ValueError:
-            # Expected - __post_init__ validates max_tokens
-            pass
+        assert _err_contains(errors, "endpoint") or _err_contains(errors, "url")
+
+    def test_invalid_provider_invalid_max_tokens(self, provider_factory):
+        """Test that __post_init__ rejects a negative max_tokens."""
+        with pytest.raises(ValueError, match="max_tokens must be positive"):
+            provider_factory(max_tokens=-100)
+
+    @pytest.mark.parametrize(
+        "values,needle",
+        [
+            pytest.param({"temperature": 3.0}, "temperature", id="temperature"),
+            pytest.param({"max_tokens": 0}, "max_tokens", id="max_tokens"),
+        ],
+    )
+    def test_validator_reports_values_post_init_rejects(self, values, needle):
+        """Test the range checks __post_init__ normally keeps the validator from seeing."""
+        provider = _raw_provider(
+            name="test", api_key="sk-test-1234567890", endpoint="https://api.com", **values
+        )
+        errors = validate_provider(provider)
+        assert len(errors) == 1
+        assert _err_contains(errors, needle)
 
 
 class TestIsLocalhost:
@@ -308,122 +273,49 @@ class TestIsValidUrl:
 class TestValidateProviderConfig:
     """Test provider config validation from raw values."""
 
-    def test_valid_provider_config_minimal(self):
-        """Test valid minimal config."""
-        errors = validate_provider_config(
-            "test",
-            "sk-test-1234567890",
-            "https://api.com",
-        )
-        assert len(errors) == 0
-
-    def test_valid_provider_config_complete(self):
-        """Test valid complete config."""
-        errors = validate_provider_config(
-            "test",
-            "sk-test-1234567890",
-            "https://api.openai.com/v1",
-            0.8,
-            1000,
-        )
-        assert len(errors) == 0
-
-    def test_invalid_provider_config_empty_name(self):
-        """Test config with empty name."""
-        errors = validate_provider_config(
-            "",
-            "sk-test-1234567890",
-            "https://api.com",
-        )
-        assert len(errors) >= 1
-
-    def test_invalid_provider_config_short_api_key(self):
-        """Test config with short API key."""
-        errors = validate_provider_config(
-            "test",
-            "short",
-            "https://api.com",
-        )
-        assert len(errors) >= 1
-
-    def test_invalid_provider_config_bad_endpoint(self):
-        """Test config with invalid endpoint."""
-        errors = validate_provider_config(
-            "test",
-            "sk-test-1234567890",
-            "not-a-url",
-        )
-        assert len(errors) >= 1
-
-    def test_invalid_provider_config_bad_temperature(self):
-        """Test config with invalid temperature."""
-        errors = validate_provider_config(
-            "test",
-            "sk-test-1234567890",
-            "https://api.com",
-            3.0,
-        )
-        assert len(errors) >= 1
-
-    def test_invalid_provider_config_bad_max_tokens(self):
-        """Test config with invalid max_tokens."""
-        errors = validate_provider_config(
-            "test",
-            "sk-test-1234567890",
-            "https://api.com",
-            0.7,
-            -100,
-        )
-        assert len(errors) >= 1
-
-    def test_invalid_provider_config_multiple_errors(self):
-        """Test config with multiple validation errors."""
-        errors = validate_provider_config(
-            "",
-            "short",
-            "not-a-url",
-            3.0,
-            -100,
-        )
-        # Should have multiple errors
-        assert len(errors) >= 3
+    @pytest.mark.parametrize(
+        "args,min_errors",
+        [
+            pytest.param(("test", "sk-test-1234567890", "https://api.com"), 0, id="minimal"),
+            pytest.param(
+                ("test", "sk-test-1234567890", "https://api.openai.com/v1", 0.8, 1000),
+                0,
+                id="complete",
+            ),
+            pytest.param(("", "sk-test-1234567890", "https://api.com"), 1, id="empty_name"),
+            pytest.param(("test", "short", "https://api.com"), 1, id="short_api_key"),
+            pytest.param(("test", "sk-test-1234567890", "not-a-url"), 1, id="bad_endpoint"),
+            pytest.param(
+                ("test", "sk-test-1234567890", "https://api.com", 3.0), 1, id="bad_temperature"
+            ),
+            pytest.param(
+                ("test", "sk-test-1234567890", "https://api.com", 0.7, -100),
+                1,
+                id="bad_max_tokens",
+            ),
+            pytest.param(("", "short", "not-a-url", 3.0, -100), 3, id="multiple_errors"),
+        ],
+    )
+    def test_validate_provider_config(self, args, min_errors):
+        """Test that each invalid raw value adds at least one error."""
+        errors = validate_provider_config(*args)
+        if min_errors:
+            assert len(errors) >= min_errors
+        else:
+            assert errors == []
 
 
 class TestIntegration:
     """Integration tests for validation."""
 
-    def test_validate_real_openai_config(self):
-        """Test validation with realistic OpenAI config."""
-        provider = AIProvider(
-            name="openai",
-            api_key="sk-proj-abcdefghijklmnopqrstuvwxyz123456789",
-            endpoint="https://api.openai.com/v1",
-            model="gpt-4",
-            temperature=0.7,
-            max_tokens=2000,
-        )
-        errors = validate_provider(provider)
-        assert len(errors) == 0
-
-    def test_validate_real_anthropic_config(self):
-        """Test validation with realistic Anthropic config."""
-        provider = AIProvider(
-            name="anthropic",
-            api_key="sk-ant-REDACTED",
-            endpoint="https://api.anthropic.com/v1",
-            model="claude-3-opus-20240229",
-            temperature=0.8,
-        )
-        errors = validate_provider(provider)
-        assert len(errors) == 0
-
-    def test_validate_local_provider_config(self):
-        """Test validation with local provider."""
-        provider = AIProvider(
-            name="local-ollama",
-            api_key="sk-local-test-key-1234567890",
-            endpoint="http://localhost:11434",
-            model="llama2",
-        )
-        errors = validate_provider(provider)
-        assert len(errors) == 0
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            pytest.param("openai_provider", id="openai"),
+            pytest.param("anthropic_provider", id="anthropic"),
+            pytest.param("local_provider", id="local"),
+        ],
+    )
+    def test_validate_realistic_config(self, request, fixture_name):
+        """Test validation with realistic provider configs."""
+        assert validate_provider(request.getfixturevalue(fixture_name)) == []
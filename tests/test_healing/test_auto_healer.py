@@ -1,10 +1,11 @@
 """Tests for the AutoHealer class."""
 
 import asyncio
+import itertools
 import tempfile
-from datetime import datetime
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -18,6 +19,60 @@ from vibe_coder.healing.types import (
 )
 from vibe_coder.healing.validators import CodeValidator
 
+# AutoHealer only reads its config, so tests that want the defaults share one
+_DEFAULT_CFG = HealingConfig()
+
+# Fixed attempt timestamp for hand-built history; no test reads it
+_T0 = "2024-01-01T00:00:00"
+
+
+@dataclass
+class _HealerMocks:
+    """The AsyncMock collaborators handed to AutoHealer in heal tests."""
+
+    api_client: AsyncMock = field(default_factory=AsyncMock)
+    validator: AsyncMock = field(default_factory=AsyncMock)
+
+
+@pytest.fixture(scope="module")
+def _module_mocks():
+    """Create the AsyncMocks once per module; ``mocks`` resets them per test."""
+    return _HealerMocks()
+
+
+@pytest.fixture
+def mocks(_module_mocks):
+    """Return the shared api_client/validator mocks with calls and responses cleared."""
+    _module_mocks.api_client.reset_mock()
+    _module_mocks.validator.reset_mock()
+    # Only the configured methods: resetting the parents' return values
+    # would also wipe the default __bool__ and friends on AsyncMock
+    _module_mocks.api_client.send_request.reset_mock(return_value=True, side_effect=True)
+    _module_mocks.validator.validate.reset_mock(return_value=True, side_effect=True)
+    return _module_mocks
+
+
+@pytest.fixture(scope="module")
+def healer(tmp_path_factory):
+    """Shared AutoHealer for tests that never change its state."""
+    return AutoHealer(
+        MagicMock(),
+        validator=MagicMock(),
+        config=_DEFAULT_CFG,
+        backup_dir=str(tmp_path_factory.mktemp("backups")),
+    )
+
+
+@pytest.fixture
+def backup_healer(tmp_path):
+    """Per-test AutoHealer with its own backup directory under tmp_path."""
+    return AutoHealer(
+        MagicMock(),
+        validator=MagicMock(),
+        config=_DEFAULT_CFG,
+        backup_dir=str(tmp_path / "backups"),
+    )
+
 
 class TestAutoHealerInitialization:
     """Test AutoHealer initialization."""
@@ -65,17 +120,17 @@ class TestHealCode:
     """Test the heal_code method."""
 
     @pytest.mark.asyncio
-    async def test_heal_valid_code(self):
+    async def test_heal_valid_code(self, mocks):
         """Test healing already valid code."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         # Return valid result
         mock_validator.validate.return_value = [
             ValidationResult(is_valid=True, strategy=ValidationStrategy.SYNTAX)
         ]
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
         code = "def hello():\n    return 'world'"
         result = await healer.heal_code(code, "python")
@@ -91,10 +146,10 @@ class TestHealCode:
         mock_api_client.send_request.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_heal_invalid_code_success(self):
+    async def test_heal_invalid_code_success(self, mocks):
         """Test successful healing of invalid code."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         # First call returns invalid, second returns valid
         mock_validator.validate.side_effect = [
@@ -113,7 +168,7 @@ class TestHealCode:
         mock_response.content = "def hello():\n    return 'world'"
         mock_api_client.send_request.return_value = mock_response
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
         code = "def hello(\n    return 'world'"  # Invalid syntax
         result = await healer.heal_code(code, "python")
@@ -127,10 +182,10 @@ class TestHealCode:
         assert len(result.errors_remaining) == 0
 
     @pytest.mark.asyncio
-    async def test_heal_with_max_attempts(self):
+    async def test_heal_with_max_attempts(self, mocks):
         """Test healing with maximum attempts reached."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         # Always return invalid
         mock_validator.validate.return_value = [
@@ -157,10 +212,10 @@ class TestHealCode:
         assert mock_api_client.send_request.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_heal_with_custom_prompt(self):
+    async def test_heal_with_custom_prompt(self, mocks):
         """Test healing with custom prompt."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(
@@ -174,7 +229,7 @@ class TestHealCode:
         mock_response.content = "def add(a: int, b: int) -> int:\n    return a + b"
         mock_api_client.send_request.return_value = mock_response
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
         custom_prompt = "Fix this code: {code}\nErrors: {errors}"
         code = "def add(a, b):\n    return a + b"
@@ -187,10 +242,10 @@ class TestHealCode:
         assert "Fix this code:" in prompt
 
     @pytest.mark.asyncio
-    async def test_heal_with_backup(self):
+    async def test_heal_with_backup(self, mocks, tmp_path):
         """Test healing with backup creation."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(
@@ -203,17 +258,22 @@ class TestHealCode:
         mock_api_client.send_request.return_value = mock_response
 
         config = HealingConfig(save_before_healing=True)
-        healer = AutoHealer(mock_api_client, validator=mock_validator, config=config)
+        backup_dir = tmp_path / "backups"
+        healer = AutoHealer(
+            mock_api_client, validator=mock_validator, config=config, backup_dir=str(backup_dir)
+        )
 
-        with patch("pathlib.Path.write_text") as mock_write:
-            await healer.heal_code(code="broken code", language="python", file_path="/tmp/test.py")
-            mock_write.assert_called_once()
+        await healer.heal_code(code="broken code", language="python", file_path="/tmp/test.py")
+
+        backups = list(backup_dir.glob("test.py.*.bak"))
+        assert len(backups) == 1
+        assert backups[0].read_text() == "broken code"
 
     @pytest.mark.asyncio
-    async def test_heal_multiple_strategies(self):
+    async def test_heal_multiple_strategies(self, mocks):
         """Test healing with multiple validation strategies."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         # Multiple strategy failures
         mock_validator.validate.return_value = [
@@ -239,10 +299,10 @@ class TestHealCode:
         assert mock_validator.validate.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_heal_with_ai_failure(self):
+    async def test_heal_with_ai_failure(self, mocks):
         """Test healing when AI request fails."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(
@@ -253,7 +313,7 @@ class TestHealCode:
         # AI request fails
         mock_api_client.send_request.side_effect = Exception("AI service unavailable")
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
         code = "broken code"
         result = await healer.heal_code(code, "python")
@@ -263,10 +323,10 @@ class TestHealCode:
         assert "Error: AI service unavailable" in result.attempts[0].ai_response
 
     @pytest.mark.asyncio
-    async def test_heal_with_partial_success(self):
+    async def test_heal_with_partial_success(self, mocks):
         """Test healing with partial error fixing."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         # Initial errors
         initial_errors = ["Syntax error", "Type error", "Lint error"]
@@ -309,10 +369,10 @@ class TestHealCode:
         assert len(result.errors_remaining) == 1
 
     @pytest.mark.asyncio
-    async def test_heal_with_no_code_changes(self):
+    async def test_heal_with_no_code_changes(self, mocks):
         """Test healing when AI returns same code."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(
@@ -336,15 +396,54 @@ class TestHealCode:
         assert len(result.attempts) == 2
         assert "PREVIOUS ATTEMPT RETURNED SAME CODE" in result.attempts[0].ai_prompt
 
+    @pytest.mark.asyncio
+    async def test_unchanged_code_is_validated_once(self, mocks):
+        """Test that code the AI returns unchanged is not validated again."""
+        mocks.validator.validate.return_value = [
+            ValidationResult(
+                is_valid=False, errors=["Syntax error"], strategy=ValidationStrategy.SYNTAX
+            )
+        ]
+        mocks.api_client.send_request.return_value = MagicMock(content="broken code")
+
+        healer = AutoHealer(
+            mocks.api_client, validator=mocks.validator, config=HealingConfig(max_attempts=3)
+        )
+        result = await healer.heal_code("broken code", "python")
+
+        assert len(result.attempts) == 3
+        assert mocks.validator.validate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_timestamps_come_from_clock(self, mocks):
+        """Test that each attempt is stamped by the injected clock."""
+        mocks.validator.validate.return_value = [
+            ValidationResult(
+                is_valid=False, errors=["Syntax error"], strategy=ValidationStrategy.SYNTAX
+            )
+        ]
+        mocks.api_client.send_request.return_value = MagicMock(content="broken code")
+        ticks = itertools.count()
+
+        healer = AutoHealer(
+            mocks.api_client,
+            validator=mocks.validator,
+            config=HealingConfig(max_attempts=3),
+            clock=lambda: f"t{next(ticks)}",
+        )
+        result = await healer.heal_code("broken code", "python")
+
+        assert [a.timestamp for a in result.attempts] == ["t0", "t1", "t2"]
+
 
 class TestHealFile:
     """Test the heal_file method."""
 
     @pytest.mark.asyncio
-    async def test_heal_file_success(self):
+    async def test_heal_file_success(self, mocks, tmp_path):
         """Test successful file healing."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(
@@ -357,32 +456,26 @@ class TestHealFile:
         mock_response.content = "fixed code"
         mock_api_client.send_request.return_value = mock_response
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("broken code")
-            temp_path = f.name
+        path = tmp_path / "broken.py"
+        path.write_text("broken code")
 
-        try:
-            result = await healer.heal_file(temp_path)
-            assert result.success is True
-            assert result.original_code == "broken code"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        result = await healer.heal_file(str(path))
+        assert result.success is True
+        assert result.original_code == "broken code"
 
     @pytest.mark.asyncio
-    async def test_heal_file_not_found(self):
+    async def test_heal_file_not_found(self, healer):
         """Test healing non-existent file."""
-        healer = AutoHealer(MagicMock())
-
         with pytest.raises(FileNotFoundError, match="File not found"):
             await healer.heal_file("/nonexistent/file.py")
 
     @pytest.mark.asyncio
-    async def test_heal_file_with_save(self):
+    async def test_heal_file_with_save(self, mocks, tmp_path):
         """Test healing file with save option."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(
@@ -395,47 +488,45 @@ class TestHealFile:
         mock_response.content = "fixed code"
         mock_api_client.send_request.return_value = mock_response
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("broken code")
-            temp_path = f.name
+        path = tmp_path / "broken.py"
+        path.write_text("broken code")
 
-        try:
-            result = await healer.heal_file(temp_path, save_result=True)
-            assert result.success is True
+        result = await healer.heal_file(str(path), save_result=True)
+        assert result.success is True
 
-            # Check file was updated
-            with open(temp_path, "r") as f:
-                assert f.read() == "fixed code"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        # Check file was updated
+        assert path.read_text() == "fixed code"
 
     @pytest.mark.asyncio
-    async def test_heal_file_language_detection(self):
+    @pytest.mark.parametrize(
+        "suffix,content,language",
+        [
+            pytest.param(".py", "def test(): pass", "python", id="python"),
+            pytest.param(".js", "function test() {}", "javascript", id="javascript"),
+            pytest.param(".ts", "const x: number = 1;", "typescript", id="typescript"),
+        ],
+    )
+    async def test_heal_file_language_detection(self, mocks, tmp_path, suffix, content, language):
         """Test language detection from file extension."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(is_valid=True, strategy=ValidationStrategy.SYNTAX)
         ]
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as f:
-            f.write("function test() {}")
-            temp_path = f.name
+        path = tmp_path / f"source{suffix}"
+        path.write_text(content)
 
-        try:
-            result = await healer.heal_file(temp_path)
-            assert result.success is True
-            # Should detect JavaScript from .js extension
-            mock_validator.validate.assert_called_with(
-                "function test() {}", "javascript", healer.config.strategies, temp_path
-            )
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        result = await healer.heal_file(str(path))
+        assert result.success is True
+        mock_validator.validate.assert_called_with(
+            content, language, healer.config.strategies, str(path)
+        )
 
 
 class TestHelperMethods:
@@ -443,9 +534,7 @@ class TestHelperMethods:
 
     def test_build_fix_prompt(self):
         """Test prompt building."""
-        healer = AutoHealer(MagicMock())
-
-        prompt = healer._build_fix_prompt(
+        prompt = AutoHealer._build_fix_prompt(
             code="def test():\n    pass",
             language="python",
             errors="IndentationError: expected an indented block",
@@ -460,157 +549,143 @@ class TestHelperMethods:
         assert "Unused variable" in prompt
         assert "This is a test function" in prompt
 
-    def test_extract_code_from_response_markdown(self):
-        """Test code extraction from markdown."""
-        healer = AutoHealer(MagicMock())
-
-        response = """Here's the fixed code:
-
-```python
-def hello():
-    return "world"
-```"""
-
-        extracted = healer._extract_code_from_response(response, "python")
-        assert extracted == 'def hello():\n    return "world"'
-
-    def test_extract_code_from_response_plain(self):
-        """Test code extraction from plain text."""
-        healer = AutoHealer(MagicMock())
-
-        response = 'def hello():\n    return "world"'
-
-        extracted = healer._extract_code_from_response(response, "python")
-        assert extracted == 'def hello():\n    return "world"'
-
-    def test_extract_code_fallback(self):
-        """Test code extraction fallback."""
-        healer = AutoHealer(MagicMock())
-
-        response = "Some explanatory text\nand more text"
-
-        extracted = healer._extract_code_from_response(response, "python")
-        assert extracted == response
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            pytest.param(
+                'Here\'s the fixed code:\n\n```python\ndef hello():\n    return "world"\n```',
+                'def hello():\n    return "world"',
+                id="markdown",
+            ),
+            pytest.param(
+                'def hello():\n    return "world"',
+                'def hello():\n    return "world"',
+                id="plain",
+            ),
+            pytest.param(
+                "Some explanatory text\nand more text",
+                "Some explanatory text\nand more text",
+                id="fallback",
+            ),
+        ],
+    )
+    def test_extract_code_from_response(self, response, expected):
+        """Test code extraction from markdown, plain code and prose responses."""
+        assert AutoHealer._extract_code_from_response(response, "python") == expected
 
     def test_looks_like_code_python(self):
         """Test Python code detection."""
-        healer = AutoHealer(MagicMock())
-
-        assert healer._looks_like_code("def test():", "python")
-        assert healer._looks_like_code("import os", "python")
-        assert healer._looks_like_code("    x = 1", "python")
-        assert not healer._looks_like_code("This is a comment", "python")
+        assert AutoHealer._looks_like_code("def test():", "python")
+        assert AutoHealer._looks_like_code("import os", "python")
+        assert AutoHealer._looks_like_code("    x = 1", "python")
+        assert not AutoHealer._looks_like_code("This is a comment", "python")
 
     def test_collect_errors(self):
         """Test error collection."""
-        healer = AutoHealer(MagicMock())
-
         results = [
             ValidationResult(errors=["Error 1", "Error 2"]),
             ValidationResult(errors=["Error 3"]),
             ValidationResult(errors=[]),
         ]
 
-        errors = healer._collect_errors(results)
+        errors = AutoHealer._collect_errors(results)
         assert errors == ["Error 1", "Error 2", "Error 3"]
 
     def test_collect_warnings(self):
         """Test warning collection."""
-        healer = AutoHealer(MagicMock())
-
         results = [
             ValidationResult(warnings=["Warning 1"]),
             ValidationResult(warnings=["Warning 2", "Warning 3"]),
             ValidationResult(warnings=[]),
         ]
 
-        warnings = healer._collect_warnings(results)
+        warnings = AutoHealer._collect_warnings(results)
         assert warnings == ["Warning 1", "Warning 2", "Warning 3"]
 
-    def test_detect_language(self):
-        """Test language detection from file path."""
-        healer = AutoHealer(MagicMock())
+    def test_collect_errors_and_warnings_keep_order(self):
+        """Test that messages from many results come back flattened in order."""
+        results = [
+            ValidationResult(is_valid=False, errors=[f"E{i}a", f"E{i}b"], warnings=[f"W{i}"])
+            for i in range(1000)
+        ]
 
-        assert healer._detect_language("test.py") == "python"
-        assert healer._detect_language("test.js") == "javascript"
-        assert healer._detect_language("test.ts") == "typescript"
-        assert healer._detect_language("test.go") == "go"
-        assert healer._detect_language("test.rs") == "rust"
-        assert healer._detect_language("test.java") == "java"
-        assert healer._detect_language("test.unknown") == "text"
+        errors = AutoHealer._collect_errors(results)
+        warnings = AutoHealer._collect_warnings(results)
+
+        assert len(errors) == 2000
+        assert errors[:4] == ["E0a", "E0b", "E1a", "E1b"]
+        assert errors[-1] == "E999b"
+        assert warnings == [f"W{i}" for i in range(1000)]
+
+    @pytest.mark.parametrize(
+        "file_path,language",
+        [
+            ("test.py", "python"),
+            ("test.js", "javascript"),
+            ("test.ts", "typescript"),
+            ("test.go", "go"),
+            ("test.rs", "rust"),
+            ("test.java", "java"),
+            ("test.unknown", "text"),
+        ],
+    )
+    def test_detect_language(self, file_path, language):
+        """Test language detection from file path."""
+        assert AutoHealer._detect_language(file_path) == language
 
-    def test_create_backup(self):
+    def test_create_backup(self, backup_healer):
         """Test backup creation."""
-        healer = AutoHealer(MagicMock())
+        code = "test code"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            healer.backup_dir = Path(tmpdir) / "backups"
-            code = "test code"
-
-            backup_path = healer._create_backup("test.py", code)
+        backup_path = backup_healer._create_backup("test.py", code)
 
-            assert backup_path.exists()
-            assert backup_path.name.startswith("test.py.")
-            assert backup_path.name.endswith(".bak")
-            assert backup_path.read_text() == code
+        assert backup_path.exists()
+        assert backup_path.name.startswith("test.py.")
+        assert backup_path.name.endswith(".bak")
+        assert backup_path.read_text() == code
 
-    def test_restore_backup(self):
+    def test_restore_backup(self, backup_healer, tmp_path):
         """Test backup restoration."""
-        healer = AutoHealer(MagicMock())
+        backup_healer.backup_dir.mkdir()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            healer.backup_dir = Path(tmpdir) / "backups"
-            healer.backup_dir.mkdir()
+        # Create backup
+        backup_path = backup_healer.backup_dir / "test.py.20240101_120000.bak"
+        backup_path.write_text("backup content")
 
-            # Create backup
-            backup_path = healer.backup_dir / "test.py.20240101_120000.bak"
-            backup_path.write_text("backup content")
+        # Create target file
+        target_path = tmp_path / "test.py"
+        target_path.write_text("original content")
 
-            # Create target file
-            target_path = Path(tmpdir) / "test.py"
-            target_path.write_text("original content")
+        result = backup_healer.restore_backup(str(target_path))
 
-            result = healer.restore_backup(str(target_path))
+        assert result is True
+        assert target_path.read_text() == "backup content"
 
-            assert result is True
-            assert target_path.read_text() == "backup content"
-
-    def test_restore_backup_no_backups(self):
+    def test_restore_backup_no_backups(self, backup_healer):
         """Test restore with no backups available."""
-        healer = AutoHealer(MagicMock())
-
-        result = healer.restore_backup("nonexistent.py")
+        result = backup_healer.restore_backup("nonexistent.py")
         assert result is False
 
-    def test_list_backups(self):
+    def test_list_backups(self, backup_healer):
         """Test listing backups."""
-        healer = AutoHealer(MagicMock())
+        backup_healer.backup_dir.mkdir()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            healer.backup_dir = Path(tmpdir) / "backups"
-            healer.backup_dir.mkdir()
-
-            # Create some backups
-            for i in range(3):
-                backup_path = healer.backup_dir / f"test.py.2024010{i}_120000.bak"
-                backup_path.write_text(f"backup {i}")
+        # Create some backups
+        for i in range(3):
+            backup_path = backup_healer.backup_dir / f"test.py.2024010{i}_120000.bak"
+            backup_path.write_text(f"backup {i}")
 
-            backups = healer.list_backups("test.py")
-            assert len(backups) == 3
-            assert all("test.py" in b.name for b in backups)
+        backups = backup_healer.list_backups("test.py")
+        assert len(backups) == 3
+        assert all("test.py" in b.name for b in backups)
 
-    def test_list_backups_no_directory(self):
+    def test_list_backups_no_directory(self, backup_healer):
         """Test listing backups with no directory."""
-        healer = AutoHealer(MagicMock())
-        healer.backup_dir = Path("/nonexistent")
-
-        backups = healer.list_backups()
+        backups = backup_healer.list_backups()
         assert backups == []
 
-    def test_get_healing_stats_empty(self):
+    def test_get_healing_stats_empty(self, healer):
         """Test getting stats with no history."""
-        healer = AutoHealer(MagicMock())
-
         stats = healer.get_healing_stats()
 
         assert stats["total_healings"] == 0
@@ -621,9 +696,9 @@ def hello():
         assert stats["avg_time"] == 0.0
         assert stats["total_errors_fixed"] == 0
 
-    def test_get_healing_stats_with_history(self):
+    def test_get_healing_stats_with_history(self, backup_healer):
         """Test getting stats with healing history."""
-        healer = AutoHealer(MagicMock())
+        healer = backup_healer
 
         # Add some mock history
         healer.healing_history = [
@@ -631,11 +706,7 @@ def hello():
                 success=True,
                 original_code="code1",
                 final_code="fixed1",
-                attempts=[
-                    HealingAttempt(
-                        1, "code1", "fixed1", [], "", "", datetime.now().isoformat(), True
-                    )
-                ],
+                attempts=[HealingAttempt(1, "code1", "fixed1", [], "", "", _T0, True)],
                 total_time=1.5,
                 errors_fixed=["error1", "error2"],
                 errors_remaining=[],
@@ -644,11 +715,7 @@ def hello():
                 success=False,
                 original_code="code2",
                 final_code="code2",
-                attempts=[
-                    HealingAttempt(
-                        1, "code2", "code2", [], "", "", datetime.now().isoformat(), False
-                    )
-                ],
+                attempts=[HealingAttempt(1, "code2", "code2", [], "", "", _T0, False)],
                 total_time=2.0,
                 errors_fixed=[],
                 errors_remaining=["error3"],
@@ -671,22 +738,24 @@ class TestCodeExtraction:
 
     def test_extract_code_with_language_specific_patterns(self):
         """Test code extraction with language-specific patterns."""
-        healer = AutoHealer(MagicMock())
-
         # Test with different language patterns
         js_response = "```javascript\nfunction test() { return true; }\n```"
-        extracted = healer._extract_code_from_response(js_response, "javascript")
+        extracted = AutoHealer._extract_code_from_response(js_response, "javascript")
         assert "function test()" in extracted
 
         # Test with generic python pattern
         py_response = "```python\nprint('hello')\n```"
-        extracted = healer._extract_code_from_response(py_response, "python")
+        extracted = AutoHealer._extract_code_from_response(py_response, "python")
         assert extracted == "print('hello')"
 
+    def test_extract_code_language_with_regex_metacharacters(self):
+        """Test that the language name is matched literally in the fence."""
+        response = "```c++\nint main() { return 0; }\n```"
+        extracted = AutoHealer._extract_code_from_response(response, "c++")
+        assert extracted == "int main() { return 0; }"
+
     def test_extract_code_mixed_content(self):
         """Test code extraction from mixed content."""
-        healer = AutoHealer(MagicMock())
-
         response = """Here's what I found wrong:
 
 The issue is with the indentation. Here's the fix:
@@ -698,23 +767,19 @@ def hello():
 
 This should fix the problem."""
 
-        extracted = healer._extract_code_from_response(response, "python")
+        extracted = AutoHealer._extract_code_from_response(response, "python")
         assert extracted == 'def hello():\n    print("world")'
 
     def test_extract_code_no_code_blocks(self):
         """Test extraction when no code blocks are present."""
-        healer = AutoHealer(MagicMock())
-
         # Response with no code blocks but looks like code
         response = "def test():\n    return 'Hello, World!'"
 
-        extracted = healer._extract_code_from_response(response, "python")
+        extracted = AutoHealer._extract_code_from_response(response, "python")
         assert extracted == response
 
     def test_extract_code_with_explanations(self):
         """Test extraction filtering out explanations."""
-        healer = AutoHealer(MagicMock())
-
         response = """# Here's the fixed function
 def test():
     # This is a comment
@@ -722,7 +787,7 @@ def test():
 
 # End of function"""
 
-        extracted = healer._extract_code_from_response(response, "python")
+        extracted = AutoHealer._extract_code_from_response(response, "python")
         # Should include actual code but filter some explanatory text
         assert "def test():" in extracted
         assert "return True" in extracted
@@ -732,21 +797,17 @@ def test():
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    async def test_heal_with_timeout(self):
+    async def test_heal_with_timeout(self, mocks):
         """Test healing with timeout configuration."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(is_valid=False, errors=["Error"], strategy=ValidationStrategy.SYNTAX)
         ]
 
-        # Simulate timeout by making AI take too long
-        async def slow_send_request(*args, **kwargs):
-            await asyncio.sleep(2)
-            return MagicMock(content="fixed code")
-
-        mock_api_client.send_request = slow_send_request
+        # Simulate the AI request timing out without actually waiting
+        mock_api_client.send_request.side_effect = asyncio.TimeoutError()
 
         config = HealingConfig(timeout_seconds=1)
         healer = AutoHealer(mock_api_client, validator=mock_validator, config=config)
@@ -755,25 +816,25 @@ class TestEdgeCases:
         result = await healer.heal_code("broken", "python")
         assert len(result.attempts) == 1
 
-    async def test_heal_empty_code(self):
+    async def test_heal_empty_code(self, mocks):
         """Test healing empty code."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(is_valid=True, strategy=ValidationStrategy.SYNTAX)
         ]
 
-        healer = AutoHealer(mock_api_client, validator=mock_validator)
+        healer = AutoHealer(mock_api_client, validator=mock_validator, config=_DEFAULT_CFG)
 
         result = await healer.heal_code("", "python")
         assert result.success is True
         assert result.final_code == ""
 
-    async def test_heal_with_context_accumulation(self):
+    async def test_heal_with_context_accumulation(self, mocks):
         """Test context accumulation across attempts."""
-        mock_api_client = AsyncMock()
-        mock_validator = AsyncMock()
+        mock_api_client = mocks.api_client
+        mock_validator = mocks.validator
 
         mock_validator.validate.return_value = [
             ValidationResult(is_valid=False, errors=["Error"], strategy=ValidationStrategy.SYNTAX)
@@ -2,7 +2,7 @@
 Tests to verify that the testing infrastructure is working correctly.
 """
 
-from pathlib import Path
+import asyncio
 
 import pytest
 
@@ -13,26 +13,110 @@ from vibe_coder.types.config import AIProvider, AppConfig
 class TestFixtures:
     """Test that all fixtures are working correctly."""
 
-    def test_temp_dir(self, temp_dir: Path):
-        """Test the temp_dir fixture."""
-        assert temp_dir.exists()
-        assert temp_dir.is_dir()
-        # Verify it's actually in a temp location
-        assert "vibe_coder_test_" in str(temp_dir)
-
-    def test_sample_python_project(self, sample_python_project: Path):
-        """Test the sample_python_project fixture."""
-        assert sample_python_project.exists()
-        assert (sample_python_project / "src").exists()
-        assert (sample_python_project / "tests").exists()
-        assert (sample_python_project / "pyproject.toml").exists()
-        assert (sample_python_project / "README.md").exists()
-
-    def test_git_repository(self, git_repository: Path):
-        """Test the git_repository fixture."""
-        assert git_repository.exists()
-        assert (git_repository / ".git").exists()
-        assert (git_repository / ".git").is_dir()
+    @pytest.mark.parametrize(
+        "fixture_name,predicate",
+        [
+            pytest.param("temp_dir", lambda v: v.is_dir(), id="temp_dir"),
+            pytest.param(
+                "sample_python_project",
+                lambda v: all(
+                    (v / name).exists() for name in ("src", "tests", "pyproject.toml", "README.md")
+                ),
+                id="sample_python_project",
+            ),
+            pytest.param("git_repository", lambda v: (v / ".git").is_dir(), id="git_repository"),
+            pytest.param(
+                "mock_openai_client",
+                lambda v: all(
+                    hasattr(v, attr)
+                    for attr in ("send_request", "stream_request", "validate_connection")
+                ),
+                id="mock_openai_client",
+            ),
+            pytest.param(
+                "mock_anthropic_client",
+                lambda v: hasattr(v, "send_request") and hasattr(v, "stream_request"),
+                id="mock_anthropic_client",
+            ),
+            pytest.param(
+                "mock_generic_client",
+                lambda v: hasattr(v, "send_request") and hasattr(v, "stream_request"),
+                id="mock_generic_client",
+            ),
+            pytest.param(
+                "mock_provider",
+                lambda v: isinstance(v, dict)
+                and {"name", "api_key", "endpoint"} <= v.keys()
+                and v["name"] == "mock-provider",
+                id="mock_provider",
+            ),
+            pytest.param(
+                "mock_ai_response",
+                lambda v: None not in (v.content, v.usage, v.finish_reason),
+                id="mock_ai_response",
+            ),
+            pytest.param(
+                "mock_api_messages",
+                lambda v: len(v) > 0
+                and all(isinstance(msg, ApiMessage) for msg in v)
+                and v[0].role == MessageRole.SYSTEM
+                and v[1].role == MessageRole.USER,
+                id="mock_api_messages",
+            ),
+            pytest.param(
+                "mock_console",
+                lambda v: all(hasattr(v, attr) for attr in ("print", "input", "panel")),
+                id="mock_console",
+            ),
+            pytest.param(
+                "slash_command_parser", lambda v: hasattr(v, "parse"), id="slash_command_parser"
+            ),
+            pytest.param(
+                "sample_ast_data",
+                lambda v: isinstance(v, dict) and {"functions", "classes", "imports"} <= v.keys(),
+                id="sample_ast_data",
+            ),
+            pytest.param(
+                "error_snippet",
+                lambda v: isinstance(v, str) and "calculate_average" in v,
+                id="error_snippet",
+            ),
+            pytest.param(
+                "fixed_snippet",
+                lambda v: isinstance(v, str)
+                and "calculate_average" in v
+                and "if not numbers:" in v,
+                id="fixed_snippet",
+            ),
+            pytest.param("cost_tracker", lambda v: hasattr(v, "track_usage"), id="cost_tracker"),
+            pytest.param(
+                "sample_usage_data",
+                lambda v: isinstance(v, dict)
+                and {"openai", "anthropic"} <= v.keys()
+                and "requests" in v["openai"],
+                id="sample_usage_data",
+            ),
+            pytest.param(
+                "plugin_manager",
+                lambda v: hasattr(v, "load_plugins") and hasattr(v, "get_plugins"),
+                id="plugin_manager",
+            ),
+            pytest.param(
+                "sample_plugin_code",
+                lambda v: isinstance(v, str)
+                and "class CustomAnalyzer" in v
+                and "BaseAnalyzerPlugin" in v,
+                id="sample_plugin_code",
+            ),
+        ],
+    )
+    def test_fixture_contract(self, request, fixture_name, predicate):
+        """Test that each fixture provides what its consumers rely on."""
+        assert predicate(request.getfixturevalue(fixture_name))
+
+    def test_temp_dir_is_pytest_managed(self, temp_dir, tmp_path_factory):
+        """Test that temp_dir lives under pytest's base temp dir, which cleans it up."""
+        assert temp_dir.is_relative_to(tmp_path_factory.getbasetemp())
 
     async def test_config_manager(self, config_manager):
         """Test the config_manager fixture."""
@@ -56,176 +140,33 @@ class TestFixtures:
         assert len(providers) == 1
         assert sample_provider.name in providers
 
-    def test_mock_openai_client(self, mock_openai_client):
-        """Test the mock_openai_client fixture."""
-        assert mock_openai_client is not None
-        assert hasattr(mock_openai_client, "send_request")
-        assert hasattr(mock_openai_client, "stream_request")
-        assert hasattr(mock_openai_client, "validate_connection")
-
-    def test_mock_anthropic_client(self, mock_anthropic_client):
-        """Test the mock_anthropic_client fixture."""
-        assert mock_anthropic_client is not None
-        assert hasattr(mock_anthropic_client, "send_request")
-        assert hasattr(mock_anthropic_client, "stream_request")
-
-    def test_mock_generic_client(self, mock_generic_client):
-        """Test the mock_generic_client fixture."""
-        assert mock_generic_client is not None
-        assert hasattr(mock_generic_client, "send_request")
-        assert hasattr(mock_generic_client, "stream_request")
-
-    def test_mock_provider(self, mock_provider):
-        """Test the mock_provider fixture."""
-        assert isinstance(mock_provider, dict)
-        assert "name" in mock_provider
-        assert "api_key" in mock_provider
-        assert "endpoint" in mock_provider
-        assert mock_provider["name"] == "mock-provider"
-
-    def test_mock_ai_response(self, mock_ai_response):
-        """Test the mock_ai_response fixture."""
-        assert mock_ai_response.content is not None
-        assert mock_ai_response.usage is not None
-        assert mock_ai_response.finish_reason is not None
-
-    def test_mock_api_messages(self, mock_api_messages):
-        """Test the mock_api_messages fixture."""
-        assert len(mock_api_messages) > 0
-        assert all(isinstance(msg, ApiMessage) for msg in mock_api_messages)
-        assert mock_api_messages[0].role == MessageRole.SYSTEM
-        assert mock_api_messages[1].role == MessageRole.USER
-
-    def test_mock_console(self, mock_console):
-        """Test the mock_console fixture."""
-        assert mock_console is not None
-        assert hasattr(mock_console, "print")
-        assert hasattr(mock_console, "input")
-        assert hasattr(mock_console, "panel")
-
-    def test_slash_command_parser(self, slash_command_parser):
-        """Test the slash_command_parser fixture."""
-        assert slash_command_parser is not None
-        assert hasattr(slash_command_parser, "parse")
-
-    def test_sample_ast_data(self, sample_ast_data):
-        """Test the sample_ast_data fixture."""
-        assert isinstance(sample_ast_data, dict)
-        assert "functions" in sample_ast_data
-        assert "classes" in sample_ast_data
-        assert "imports" in sample_ast_data
-
-    def test_error_snippet(self, error_snippet):
-        """Test the error_snippet fixture."""
-        assert isinstance(error_snippet, str)
-        assert "calculate_average" in error_snippet
-
-    def test_fixed_snippet(self, fixed_snippet):
-        """Test the fixed_snippet fixture."""
-        assert isinstance(fixed_snippet, str)
-        assert "calculate_average" in fixed_snippet
-        assert "if not numbers:" in fixed_snippet
-
-    def test_cost_tracker(self, cost_tracker):
-        """Test the cost_tracker fixture."""
-        assert cost_tracker is not None
-        assert hasattr(cost_tracker, "track_usage")
-
-    def test_sample_usage_data(self, sample_usage_data):
-        """Test the sample_usage_data fixture."""
-        assert isinstance(sample_usage_data, dict)
-        assert "openai" in sample_usage_data
-        assert "anthropic" in sample_usage_data
-        assert "requests" in sample_usage_data["openai"]
-
-    def test_plugin_manager(self, plugin_manager):
-        """Test the plugin_manager fixture."""
-        assert plugin_manager is not None
-        assert hasattr(plugin_manager, "load_plugins")
-        assert hasattr(plugin_manager, "get_plugins")
-
-    def test_sample_plugin_code(self, sample_plugin_code):
-        """Test the sample_plugin_code fixture."""
-        assert isinstance(sample_plugin_code, str)
-        assert "class CustomAnalyzer" in sample_plugin_code
-        assert "BaseAnalyzerPlugin" in sample_plugin_code
-
 
 class TestMarkedTests:
     """Test that pytest markers are working correctly."""
 
-    @pytest.mark.unit
-    def test_unit_marker(self):
-        """Test that unit marker is recognized."""
-        assert True
-
-    @pytest.mark.slow
-    def test_slow_marker(self):
-        """Test that slow marker is recognized."""
-        import time
-
-        time.sleep(0.01)  # Small delay to qualify as slow
-        assert True
-
-    @pytest.mark.cli
-    def test_cli_marker(self):
-        """Test that CLI marker is recognized."""
-        assert True
-
-    @pytest.mark.api
-    def test_api_marker(self):
-        """Test that API marker is recognized."""
-        assert True
-
-    @pytest.mark.config
-    def test_config_marker(self):
-        """Test that config marker is recognized."""
-        assert True
-
-    @pytest.mark.openai
-    def test_openai_marker(self):
-        """Test that OpenAI marker is recognized."""
-        assert True
-
-    @pytest.mark.anthropic
-    def test_anthropic_marker(self):
-        """Test that Anthropic marker is recognized."""
-        assert True
-
-    @pytest.mark.ollama
-    def test_ollama_marker(self):
-        """Test that Ollama marker is recognized."""
-        assert True
-
-    @pytest.mark.generic
-    def test_generic_marker(self):
-        """Test that generic provider marker is recognized."""
-        assert True
-
-    @pytest.mark.security
-    def test_security_marker(self):
-        """Test that security marker is recognized."""
-        assert True
-
-    @pytest.mark.reliability
-    def test_reliability_marker(self):
-        """Test that reliability marker is recognized."""
-        assert True
-
-    @pytest.mark.compatibility
-    def test_compatibility_marker(self):
-        """Test that compatibility marker is recognized."""
-        assert True
-
-    @pytest.mark.network
-    def test_network_marker(self):
-        """Test that network marker is recognized."""
-        assert True
-
-    @pytest.mark.github
-    def test_github_marker(self):
-        """Test that GitHub marker is recognized."""
-        assert True
+    @pytest.mark.parametrize(
+        "marker",
+        [
+            "unit",
+            "slow",
+            "cli",
+            "api",
+            "config",
+            "openai",
+            "anthropic",
+            "ollama",
+            "generic",
+            "security",
+            "reliability",
+            "compatibility",
+            "network",
+            "github",
+        ],
+    )
+    def test_marker_registered(self, marker, pytestconfig):
+        """Test that the marker is declared, so --strict-markers accepts it."""
+        registered = {line.split(":")[0].strip() for line in pytestconfig.getini("markers")}
+        assert marker in registered
 
 
 class TestAsyncFixtures:
@@ -233,11 +174,8 @@ class TestAsyncFixtures:
 
     @pytest.mark.asyncio
     async def test_async_fixture(self, event_loop):
-        """Test that async fixtures work correctly."""
-        assert event_loop is not None
-        import asyncio
-
-        assert isinstance(asyncio.get_event_loop(), type(event_loop))
+        """Test that async tests run on pytest-asyncio's event loop."""
+        assert asyncio.get_running_loop() is event_loop
 
     @pytest.mark.asyncio
     async def test_async_config_manager(self, config_manager_with_provider):
@@ -249,8 +187,6 @@ class TestAsyncFixtures:
     @pytest.mark.asyncio
     async def test_mock_streaming(self, mock_openai_client):
         """Test mock streaming functionality."""
-        chunks = []
-        async for chunk in mock_openai_client.stream_request([]):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in mock_openai_client.stream_request([])]
         assert len(chunks) > 0
         assert "".join(chunks) == "This is a mock streaming response"
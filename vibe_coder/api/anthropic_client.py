@@ -10,6 +10,14 @@ from vibe_coder.api.base import BaseApiClient
 from vibe_coder.types.api import ApiMessage, ApiResponse, MessageRole, TokenUsage
 from vibe_coder.types.config import AIProvider
 
+# Anthropic stop reasons mapped to OpenAI-style finish reasons
+_STOP_REASON_MAP = {
+    "end_turn": "stop",
+    "max_tokens": "length",
+    "stop_sequence": "stop",
+    "tool_use": "tool_calls",
+}
+
 
 class AnthropicClient(BaseApiClient):
     """Anthropic Claude API client using official Anthropic SDK."""
@@ -303,15 +311,7 @@ class AnthropicClient(BaseApiClient):
         )
 
         # Map Anthropic stop reasons to our format
-        finish_reason = "unknown"
-        if response.stop_reason:
-            reason_map = {
-                "end_turn": "stop",
-                "max_tokens": "length",
-                "stop_sequence": "stop",
-                "tool_use": "tool_calls",
-            }
-            finish_reason = reason_map.get(response.stop_reason, "unknown")
+        finish_reason = _STOP_REASON_MAP.get(response.stop_reason, "unknown")
 
         result = ApiResponse(
             content=content, usage=usage, finish_reason=finish_reason, tool_calls=tool_calls
@@ -5,7 +5,7 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
-from vibe_coder.types.api import ApiMessage, ApiResponse, TokenUsage
+from vibe_coder.types.api import ApiMessage, ApiResponse, TokenUsage, messages_to_dicts
 from vibe_coder.types.config import AIProvider
 
 
@@ -158,7 +158,7 @@ class BaseApiClient(ABC):
         Returns:
             List of message dictionaries
         """
-        return [message.to_dict() for message in messages]
+        return messages_to_dicts(messages)
 
     def _validate_messages(self, messages: List[ApiMessage]) -> None:
         """Validate that messages are properly formatted.
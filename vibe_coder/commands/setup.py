@@ -417,11 +417,8 @@ class SetupCommand:
         """
         self.console.print("\n[cyan]Saving configuration...[/cyan]")
 
-        # Save provider
-        config_manager.set_provider(provider.name, provider)
-
-        # Set as current provider
-        config_manager.set_current_provider(provider.name)
+        # Save provider and set it as current with a single write
+        config_manager.set_provider(provider.name, provider, current=True)
 
         self.console.print("[green]✅ Configuration saved successfully![/green]")
 
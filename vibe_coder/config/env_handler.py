@@ -14,20 +14,123 @@ Supported environment variables:
 - VIBE_CODER_PROVIDER_NAME: Custom provider name (defaults to "env")
 """
 
+import io
 import os
-from typing import Optional
+from pathlib import Path
+from typing import Any, Callable, Optional
 
-from dotenv import load_dotenv, set_key
+from dotenv import find_dotenv, load_dotenv
+from dotenv.parser import parse_stream
 
 from vibe_coder.types.config import AIProvider
 
+# Optional config fields and the environment variables they are read from
+_OPTIONAL_ENV_KEYS = (
+    ("model", "VIBE_CODER_MODEL"),
+    ("temperature", "VIBE_CODER_TEMPERATURE"),
+    ("max_tokens", "VIBE_CODER_MAX_TOKENS"),
+)
+
+# Inclusive (cast, min, max) bounds for numeric settings; None means unbounded
+_TEMPERATURE_BOUNDS: tuple[Callable[[str], float], float, Optional[float]] = (float, 0.0, 2.0)
+_MAX_TOKENS_BOUNDS: tuple[Callable[[str], int], int, Optional[int]] = (int, 1, None)
+
+# (resolved path, mtime_ns, size) of the .env file load_env_config() last loaded
+_dotenv_loaded: Optional[tuple[str, int, int]] = None
+
+
+def _load_dotenv_if_changed() -> None:
+    """
+    Load the .env file unless this same file was already loaded unmodified.
+
+    The file is located with find_dotenv(), exactly as a bare load_dotenv()
+    call would, so edits made by any writer and a switch to a different
+    .env file are both picked up.
+    """
+    global _dotenv_loaded
+
+    dotenv_path = find_dotenv()
+    if not dotenv_path:
+        return
+    try:
+        stat = os.stat(dotenv_path)
+    except OSError:
+        return
+    key = (os.path.realpath(dotenv_path), stat.st_mtime_ns, stat.st_size)
+    if key != _dotenv_loaded:
+        load_dotenv(dotenv_path)
+        _dotenv_loaded = key
+
+
+def _parse_bounded(name: str, raw: Optional[str], bounds: tuple) -> Any:
+    """
+    Cast an optional numeric setting and check it against inclusive bounds.
+
+    Args:
+        name: Setting name used in the error message
+        raw: Raw string value, or None/empty if not set
+        bounds: ``(cast, lo, hi)`` tuple; ``hi`` may be None for no upper bound
+
+    Returns:
+        The parsed value, or None if ``raw`` is empty
+
+    Raises:
+        ValueError: If the value cannot be cast or is out of bounds
+    """
+    if not raw:
+        return None
+    cast, lo, hi = bounds
+    try:
+        value = cast(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid {name} value: {raw}") from e
+    if not (lo <= value and (hi is None or value <= hi)):
+        raise ValueError(f"Invalid {name} value: {raw}")
+    return value
+
+
+def _format_env_line(key: str, value: str) -> str:
+    """
+    Format a single-quoted KEY='value' line.
+
+    Backslashes and single quotes are escaped, so load_dotenv() reads the
+    value back unchanged.
+    """
+    # Escape backslashes first so the quote escaping is not escaped in turn
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{key}='{escaped}'\n"
+
+
+def _merge_env_lines(existing: str, values: dict[str, str]) -> str:
+    """
+    Merge KEY=value pairs into the text of an existing .env file.
+
+    The text is split into bindings with python-dotenv's own parser, so
+    quoted multi-line values stay intact. Bindings for keys in ``values``
+    are replaced in place, everything else is kept verbatim, and keys not
+    already present are appended at the end.
+    """
+    out = []
+    written = set()
+    for binding in parse_stream(io.StringIO(existing)):
+        if binding.key in values:
+            out.append(_format_env_line(binding.key, values[binding.key]))
+            written.add(binding.key)
+        else:
+            out.append(binding.original.string)
+    if out and not out[-1].endswith("\n"):
+        out.append("\n")
+    out.extend(_format_env_line(key, value) for key, value in values.items() if key not in written)
+    return "".join(out)
+
 
 def load_env_config() -> Optional[dict[str, Optional[str]]]:
     """
     Load configuration from environment variables.
 
     Looks for VIBE_CODER_* prefixed environment variables. First loads
-    from .env file if it exists in the current directory.
+    from .env file if it exists in the current directory. The .env file is
+    only parsed again when it has changed on disk since the last load.
 
     Environment variables recognized:
     - VIBE_CODER_API_KEY: API authentication key (required if using env config)
@@ -46,25 +149,23 @@ def load_env_config() -> Optional[dict[str, Optional[str]]]:
         ...     print(f"Found API key: {config['api_key']}")
     """
     # Load from .env file if it exists
-    load_dotenv()
+    _load_dotenv_if_changed()
+
+    getenv = os.environ.get
 
     # Check for required variables
-    api_key = os.getenv("VIBE_CODER_API_KEY")
-    endpoint = os.getenv("VIBE_CODER_ENDPOINT")
+    api_key = getenv("VIBE_CODER_API_KEY")
+    endpoint = getenv("VIBE_CODER_ENDPOINT")
 
     # If neither required var is set, return None
     if not api_key and not endpoint:
         return None
 
     # Build config dict with found variables
-    config = {
-        "api_key": api_key or "",
-        "endpoint": endpoint or "",
-        "model": os.getenv("VIBE_CODER_MODEL"),
-        "temperature": os.getenv("VIBE_CODER_TEMPERATURE"),
-        "max_tokens": os.getenv("VIBE_CODER_MAX_TOKENS"),
-        "provider_name": os.getenv("VIBE_CODER_PROVIDER_NAME", "env"),
-    }
+    config: dict[str, Optional[str]] = {"api_key": api_key or "", "endpoint": endpoint or ""}
+    for field_name, env_key in _OPTIONAL_ENV_KEYS:
+        config[field_name] = getenv(env_key)
+    config["provider_name"] = getenv("VIBE_CODER_PROVIDER_NAME", "env")
 
     return config
 
@@ -99,27 +200,10 @@ def get_env_provider() -> Optional[AIProvider]:
     if not config.get("endpoint"):
         raise ValueError("VIBE_CODER_ENDPOINT environment variable is required")
 
-    # Parse temperature if provided
-    temperature = 0.7  # Default
-    temp_str = config.get("temperature")
-    if temp_str:
-        try:
-            temperature = float(temp_str)
-            if not (0.0 <= temperature <= 2.0):
-                raise ValueError(f"Temperature must be 0.0-2.0, got {temperature}")
-        except ValueError as e:
-            raise ValueError(f"Invalid temperature value: {temp_str}") from e
-
-    # Parse max_tokens if provided
-    max_tokens = None
-    tokens_str = config.get("max_tokens")
-    if tokens_str:
-        try:
-            max_tokens = int(tokens_str)
-            if max_tokens < 1:
-                raise ValueError("max_tokens must be positive")
-        except ValueError as e:
-            raise ValueError(f"Invalid max_tokens value: {tokens_str}") from e
+    temperature = _parse_bounded("temperature", config.get("temperature"), _TEMPERATURE_BOUNDS)
+    if temperature is None:
+        temperature = 0.7  # Default
+    max_tokens = _parse_bounded("max_tokens", config.get("max_tokens"), _MAX_TOKENS_BOUNDS)
 
     # Create and return provider
     api_key: str = config.get("api_key") or ""
@@ -148,8 +232,10 @@ def save_to_env(
     """
     Save configuration to a .env file.
 
-    Creates or updates a .env file with VIBE_CODER_* variables.
-    Displays a warning about not committing .env files to version control.
+    Creates or updates a .env file with VIBE_CODER_* variables. Existing
+    lines for other keys are preserved, and the file is written in a single
+    write. Displays a warning about not committing .env files to version
+    control.
 
     Args:
         api_key: API authentication key
@@ -180,21 +266,24 @@ def save_to_env(
     if max_tokens is not None and max_tokens < 1:
         raise ValueError(f"max_tokens must be positive, got {max_tokens}")
 
-    # Set variables
-    set_key(env_file, "VIBE_CODER_API_KEY", api_key)
-    set_key(env_file, "VIBE_CODER_ENDPOINT", endpoint)
-
+    # Collect variables
+    values = {
+        "VIBE_CODER_API_KEY": api_key,
+        "VIBE_CODER_ENDPOINT": endpoint,
+    }
     if model:
-        set_key(env_file, "VIBE_CODER_MODEL", model)
-
+        values["VIBE_CODER_MODEL"] = model
     if temperature is not None:
-        set_key(env_file, "VIBE_CODER_TEMPERATURE", str(temperature))
-
+        values["VIBE_CODER_TEMPERATURE"] = str(temperature)
     if max_tokens is not None:
-        set_key(env_file, "VIBE_CODER_MAX_TOKENS", str(max_tokens))
-
+        values["VIBE_CODER_MAX_TOKENS"] = str(max_tokens)
     if provider_name:
-        set_key(env_file, "VIBE_CODER_PROVIDER_NAME", provider_name)
+        values["VIBE_CODER_PROVIDER_NAME"] = provider_name
+
+    # Write everything at once
+    path = Path(env_file)
+    existing = path.read_text() if path.exists() else ""
+    path.write_text(_merge_env_lines(existing, values))
 
     # Print warning
     print(f"\n⚠️  Configuration saved to {env_file}")
@@ -214,4 +303,5 @@ def has_env_config() -> bool:
         >>> if has_env_config():
         ...     print("Environment configuration found")
     """
-    return bool(os.getenv("VIBE_CODER_API_KEY") or os.getenv("VIBE_CODER_ENDPOINT"))
+    getenv = os.environ.get
+    return bool(getenv("VIBE_CODER_API_KEY") or getenv("VIBE_CODER_ENDPOINT"))
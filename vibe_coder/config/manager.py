@@ -7,11 +7,34 @@ between the application and the persistent configuration store.
 """
 
 import json
+import os
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from vibe_coder.types.config import AIProvider, AppConfig, MCPServer
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (the "fast" extra)
+    orjson = None
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize config data as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse config data from JSON bytes."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class ConfigManager:
     """
@@ -37,7 +60,7 @@ class ConfigManager:
 
     def __init__(self, config_dir: Optional[Path] = None):
         """
-        Initialize ConfigManager and load existing configuration.
+        Initialize ConfigManager; existing configuration is loaded lazily.
 
         Args:
             config_dir: Optional path to config directory. Defaults to ~/.vibe
@@ -45,21 +68,32 @@ class ConfigManager:
         Side effects:
             - Creates config directory if it doesn't exist
             - Creates default config.json if it doesn't exist
-            - Loads existing configuration from disk
+            - Existing configuration is loaded from disk on first use
         """
         self.config_dir = config_dir or Path.home() / ".vibe"
         self.config_file = self.config_dir / "config.json"
 
+        # Nesting depth of batch_updates() and whether a save was deferred
+        self._batch_depth = 0
+        self._dirty = False
+
+        # Bytes and mtime of config.json as last read or written by this manager
+        self._on_disk: Optional[tuple[bytes, int]] = None
+
         # Create directory if needed
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load config from disk, or create default
-        if self.config_file.exists():
-            self._config = self._load_config()
-        else:
+        # Create a default config file if needed; an existing one is only
+        # parsed on first access to self._config
+        if not self.config_file.exists():
             self._config = AppConfig.default()
             self._save_config()
 
+    @cached_property
+    def _config(self) -> AppConfig:
+        """The in-memory configuration, loaded from disk on first access."""
+        return self._load_config()
+
     def get_provider(self, name: Optional[str] = None) -> Optional[AIProvider]:
         """
         Get a provider by name, or get the current provider.
@@ -76,25 +110,41 @@ class ConfigManager:
         """
         return self._config.get_provider(name)
 
-    def set_provider(self, name: str, provider: AIProvider) -> None:
+    def set_provider(self, name: str, provider: AIProvider, current: bool = False) -> None:
         """
         Store a provider in configuration and save to disk.
 
+        The save is skipped if an identical provider is already stored (and,
+        with ``current=True``, is already the current provider).
+
         Args:
             name: Key to store provider under
             provider: AIProvider object to store
+            current: Also make it the current provider, in the same save
 
         Examples:
             >>> provider = AIProvider(name="my-openai", ...)
             >>> manager.set_provider("my-openai", provider)
-        """
+            >>> manager.set_provider("my-openai", provider, current=True)
+        """
+        # The same object may have been edited in place since it was stored,
+        # so only a different but equal provider counts as unchanged
+        stored = self._config.providers.get(name)
+        unchanged = stored is not None and stored is not provider and stored == provider
+        if current:
+            unchanged = unchanged and self._config.current_provider == name
+            self._config.current_provider = name
         self._config.set_provider(name, provider)
+        if unchanged and not self._dirty:
+            return
         self._save_config()
 
     def set_current_provider(self, name: str) -> None:
         """
         Set the current active provider.
 
+        The save is skipped if it is already the current provider.
+
         Args:
             name: Name of provider to make current
 
@@ -106,6 +156,8 @@ class ConfigManager:
         """
         if not self._config.has_provider(name):
             raise ValueError(f"Provider '{name}' not found")
+        if self._config.current_provider == name and not self._dirty:
+            return
         self._config.current_provider = name
         self._save_config()
 
@@ -153,11 +205,13 @@ class ConfigManager:
         Side effects:
             - Removes provider from config
             - Clears current_provider if it was the deleted provider
-            - Persists changes to disk
+            - Persists changes to disk (skipped if the provider doesn't exist)
 
         Examples:
             >>> manager.delete_provider("old-provider")
         """
+        if not self._config.has_provider(name):
+            return
         self._config.delete_provider(name)
         self._save_config()
 
@@ -239,6 +293,11 @@ class ConfigManager:
         """
         Get the current AppConfig object.
 
+        This is the manager's live configuration, not a copy: it reflects
+        later provider changes made through the manager, until set_config()
+        or reset_config() replaces it. Call save_config() after changing it
+        directly.
+
         Returns:
             Current AppConfig instance
 
@@ -267,6 +326,34 @@ class ConfigManager:
         self._config = config
         self._save_config()
 
+    @contextmanager
+    def batch_updates(self) -> Iterator["ConfigManager"]:
+        """
+        Defer auto-saves until the block exits, then write config.json once.
+
+        Mutations inside the block are applied in memory immediately; the file
+        is only written when the block exits normally, and only if something
+        changed. Blocks may be nested; the outermost one saves. If the
+        outermost block raises, nothing is written, the pending save is
+        dropped and the original exception propagates.
+
+        Examples:
+            >>> with manager.batch_updates():
+            ...     manager.set_provider("my-openai", provider)
+            ...     manager.set_current_provider("my-openai")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._dirty = False
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self._write_config()
+
     def save_config(self) -> None:
         """
         Explicitly save configuration to disk.
@@ -279,7 +366,7 @@ class ConfigManager:
             >>> config.debug_mode = True
             >>> manager.save_config()
         """
-        self._save_config()
+        self._write_config()
 
     def _load_config(self) -> AppConfig:
         """
@@ -297,8 +384,10 @@ class ConfigManager:
                               __init__ was called, but possible if deleted externally)
         """
         try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
+            mtime_ns = self.config_file.stat().st_mtime_ns
+            raw = self.config_file.read_bytes()
+            self._on_disk = (raw, mtime_ns)
+            data = _loads(raw)
             return AppConfig.from_dict(data)
         except FileNotFoundError:
             # File was deleted externally, return default
@@ -309,10 +398,24 @@ class ConfigManager:
             return AppConfig.default()
 
     def _save_config(self) -> None:
+        """
+        Auto-save after a mutation, or defer it while inside batch_updates().
+        """
+        # Stays set until a write succeeds, so no-op guards never skip a
+        # save that is still owed to disk
+        self._dirty = True
+        if self._batch_depth:
+            return
+        self._write_config()
+
+    def _write_config(self) -> None:
         """
         Save configuration to config.json file.
 
-        The file is written with 2-space indentation for readability.
+        The file is written with 2-space indentation for readability, using
+        orjson when it is installed. The write is atomic: an interrupted save
+        leaves the previous config.json in place. It is skipped when the file
+        is unchanged since this manager last read or wrote the same bytes.
         Creates the config directory if needed.
 
         Raises:
@@ -322,10 +425,36 @@ class ConfigManager:
         # Ensure directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        # Convert config to dict and write
-        config_dict = self._config.to_dict()
-        with open(self.config_file, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        # Convert config to dict and write. Providers are serialized afresh on
+        # every write: they are mutable and edited in place via get_provider(),
+        # so a cached dict could only be trusted after comparing every field,
+        # which costs as much as to_dict() itself.
+        data = _dumps(self._config.to_dict())
+
+        # Skip the write if config.json still holds exactly these bytes
+        if self._on_disk is not None and self._on_disk[0] == data:
+            try:
+                stat = self.config_file.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat and stat.st_mtime_ns == self._on_disk[1] and stat.st_size == len(data):
+                self._dirty = False
+                return
+
+        # Write a temp file and rename it over config.json, so readers (and a
+        # crash mid-write) never see a partially written file
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        self._on_disk = (data, self.config_file.stat().st_mtime_ns)
+        self._dirty = False
 
 
 # Singleton instance for module-level access
@@ -8,12 +8,30 @@ with multi-strategy validation and rollback support.
 import re
 import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from vibe_coder.healing.types import HealingAttempt, HealingConfig, HealingResult, ValidationResult
 from vibe_coder.healing.validators import CodeValidator
 
+# Fallback fenced blocks tried after the requested language's own fence
+_PYTHON_BLOCK = re.compile(r"```python\n(.*?)```", re.DOTALL)
+_BARE_BLOCK = re.compile(r"```\n(.*?)```", re.DOTALL)
+
+# Any of these anywhere in a line marks it as Python code: keywords,
+# indentation, attribute access on self, assignment or a call
+_PYTHON_CODE_HINT = re.compile(
+    r"import |from |def |class |if |for |while |return |    |self\.|=|\(|\)"
+)
+
+
+@lru_cache(maxsize=32)
+def _language_block(language: str) -> "re.Pattern[str]":
+    """Return the compiled pattern for a ```<language> fenced block."""
+    return re.compile(rf"```{re.escape(language)}\n(.*?)```", re.DOTALL)
+
 
 class AutoHealer:
     """Automatically fix code issues using AI."""
@@ -24,6 +42,7 @@ class AutoHealer:
         validator: Optional[CodeValidator] = None,
         config: Optional[HealingConfig] = None,
         backup_dir: Optional[str] = None,
+        clock: Optional[Callable[[], str]] = None,
     ):
         """
         Initialize the auto-healer.
@@ -33,12 +52,15 @@ class AutoHealer:
             validator: Code validator instance
             config: Healing configuration
             backup_dir: Directory for backup files
+            clock: Returns the timestamp recorded on each attempt
+                (defaults to the current time in ISO format)
         """
         self.api_client = api_client
         self.validator = validator or CodeValidator()
         self.config = config or HealingConfig()
         self.backup_dir = Path(backup_dir) if backup_dir else Path.home() / ".vibe" / "backups"
         self.healing_history: List[HealingResult] = []
+        self._clock = clock or (lambda: datetime.now().isoformat())
 
     async def heal_code(
         self,
@@ -67,14 +89,24 @@ class AutoHealer:
         original_errors: List[str] = []
         fixed_errors: List[str] = []
 
+        # Language, strategies and file_path are fixed for this call, so the
+        # same code always validates the same way: re-validating the original
+        # code on attempt 1, or code the AI returned unchanged, is skipped.
+        validated: Dict[str, List[ValidationResult]] = {}
+
+        async def validate(source: str) -> List[ValidationResult]:
+            if source not in validated:
+                validated[source] = await self.validator.validate(
+                    source, language, self.config.strategies, file_path
+                )
+            return validated[source]
+
         # Save backup if configured
         if self.config.save_before_healing and file_path:
             self._create_backup(file_path, code)
 
         # Initial validation
-        initial_results = await self.validator.validate(
-            code, language, self.config.strategies, file_path
-        )
+        initial_results = await validate(code)
         original_errors = self._collect_errors(initial_results)
 
         # Check if already valid
@@ -92,9 +124,7 @@ class AutoHealer:
         # Healing loop
         for attempt_num in range(1, self.config.max_attempts + 1):
             # Validate current code
-            validation_results = await self.validator.validate(
-                current_code, language, self.config.strategies, file_path
-            )
+            validation_results = await validate(current_code)
 
             # Check if all validations passed
             if all(r.is_valid for r in validation_results):
@@ -137,7 +167,7 @@ class AutoHealer:
                 validation_results=validation_results,
                 ai_prompt=ai_prompt,
                 ai_response=ai_response,
-                timestamp=datetime.now().isoformat(),
+                timestamp=self._clock(),
                 success=False,
             )
             attempts.append(attempt)
@@ -151,9 +181,7 @@ class AutoHealer:
             current_code = fixed_code
 
         # Max attempts exceeded - final validation
-        final_results = await self.validator.validate(
-            current_code, language, self.config.strategies, file_path
-        )
+        final_results = await validate(current_code)
 
         remaining_errors = self._collect_errors(final_results)
         fixed_errors = [e for e in original_errors if e not in remaining_errors]
@@ -280,8 +308,8 @@ class AutoHealer:
             # Return original code if AI request fails
             return code, prompt, f"Error: {str(e)}"
 
+    @staticmethod
     def _build_fix_prompt(
-        self,
         code: str,
         language: str,
         errors: str,
@@ -343,17 +371,12 @@ class AutoHealer:
 
         return "\n".join(parts)
 
-    def _extract_code_from_response(self, response: str, language: str) -> str:
+    @staticmethod
+    def _extract_code_from_response(response: str, language: str) -> str:
         """Extract code from AI response."""
         # Try to extract from markdown code block
-        patterns = [
-            rf"```{language}\n(.*?)```",
-            r"```python\n(.*?)```",
-            r"```\n(.*?)```",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, response, re.DOTALL)
+        for pattern in (_language_block(language), _PYTHON_BLOCK, _BARE_BLOCK):
+            match = pattern.search(response)
             if match:
                 return match.group(1).strip()
 
@@ -371,7 +394,7 @@ class AutoHealer:
             if line.startswith("```"):
                 in_code = not in_code
                 continue
-            if in_code or self._looks_like_code(line, language):
+            if in_code or AutoHealer._looks_like_code(line, language):
                 code_lines.append(line)
 
         if code_lines:
@@ -380,40 +403,22 @@ class AutoHealer:
         # Return the whole response as fallback
         return response.strip()
 
-    def _looks_like_code(self, line: str, language: str) -> bool:
+    @staticmethod
+    def _looks_like_code(line: str, language: str) -> bool:
         """Check if a line looks like code."""
         if language.lower() == "python":
-            code_indicators = [
-                "import ",
-                "from ",
-                "def ",
-                "class ",
-                "if ",
-                "for ",
-                "while ",
-                "return ",
-                "    ",  # Indentation
-                "self.",
-                "=",
-                "(",
-                ")",
-            ]
-            return any(indicator in line for indicator in code_indicators)
+            return _PYTHON_CODE_HINT.search(line) is not None
         return True  # For other languages, assume it's code
 
-    def _collect_errors(self, results: List[ValidationResult]) -> List[str]:
+    @staticmethod
+    def _collect_errors(results: List[ValidationResult]) -> List[str]:
         """Collect all errors from validation results."""
-        errors = []
-        for result in results:
-            errors.extend(result.errors)
-        return errors
+        return list(chain.from_iterable(result.errors for result in results))
 
-    def _collect_warnings(self, results: List[ValidationResult]) -> List[str]:
+    @staticmethod
+    def _collect_warnings(results: List[ValidationResult]) -> List[str]:
         """Collect all warnings from validation results."""
-        warnings = []
-        for result in results:
-            warnings.extend(result.warnings)
-        return warnings
+        return list(chain.from_iterable(result.warnings for result in results))
 
     def _create_backup(self, file_path: str, content: str) -> Path:
         """Create a backup of the file before healing."""
@@ -427,7 +432,8 @@ class AutoHealer:
         backup_path.write_text(content, encoding="utf-8")
         return backup_path
 
-    def _detect_language(self, file_path: str) -> str:
+    @staticmethod
+    def _detect_language(file_path: str) -> str:
         """Detect programming language from file extension."""
         ext = Path(file_path).suffix.lower()
         language_map = {
@@ -26,7 +26,12 @@ class MessageRole(Enum):
     """Result of a tool execution"""
 
 
-@dataclass
+# Value -> member table so hot paths can resolve roles with a single dict
+# lookup instead of going through EnumMeta.__call__.
+_ROLE_BY_VALUE: Dict[str, MessageRole] = {role.value: role for role in MessageRole}
+
+
+@dataclass(slots=True)
 class ApiMessage:
     """
     A single message in a conversation.
@@ -59,6 +64,21 @@ class ApiMessage:
     name: Optional[str] = None
     """Name of the tool (if role is TOOL)"""
 
+    @classmethod
+    def system(cls, content: str) -> "ApiMessage":
+        """Create a system message."""
+        return cls(MessageRole.SYSTEM, content)
+
+    @classmethod
+    def user(cls, content: str) -> "ApiMessage":
+        """Create a user message."""
+        return cls(MessageRole.USER, content)
+
+    @classmethod
+    def assistant(cls, content: str) -> "ApiMessage":
+        """Create an assistant message."""
+        return cls(MessageRole.ASSISTANT, content)
+
     def to_dict(self) -> dict:
         """Convert message to dictionary for API requests."""
         data = {
@@ -76,8 +96,12 @@ class ApiMessage:
     @classmethod
     def from_dict(cls, data: dict) -> "ApiMessage":
         """Create message from dictionary."""
+        role = _ROLE_BY_VALUE.get(data["role"])
+        if role is None:
+            # Let the enum raise its usual ValueError for unknown roles
+            role = MessageRole(data["role"])
         return cls(
-            role=MessageRole(data["role"]),
+            role=role,
             content=data["content"],
             tool_calls=data.get("tool_calls"),
             tool_call_id=data.get("tool_call_id"),
@@ -85,7 +109,18 @@ class ApiMessage:
         )
 
 
-@dataclass
+def messages_to_dicts(messages: List[ApiMessage]) -> List[dict]:
+    """
+    Convert a list of messages to dictionaries for API requests.
+
+    The conversation history is re-sent on every turn, so the method lookup
+    is hoisted out of the loop.
+    """
+    to_dict = ApiMessage.to_dict
+    return [to_dict(message) for message in messages]
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """
     Token usage statistics from an API response.
@@ -119,7 +154,7 @@ class TokenUsage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiRequest:
     """
     Request to send to an AI API.
@@ -161,8 +196,12 @@ class ApiRequest:
     tools: Optional[List[Dict[str, Any]]] = None
     """List of available tools"""
 
+    def messages_as_dicts(self) -> List[dict]:
+        """Convert all request messages to dictionaries for API requests."""
+        return messages_to_dicts(self.messages)
+
 
-@dataclass
+@dataclass(slots=True)
 class ApiResponse:
     """
     Response from an AI API.
@@ -206,10 +245,20 @@ class ApiResponse:
 
     def to_dict(self) -> dict:
         """Convert response to dictionary."""
+        usage = self.usage
         return {
             "content": self.content,
             "model": self.model,
-            "usage": self.usage.to_dict() if self.usage else None,
+            # Inlined TokenUsage.to_dict() to skip a method call per response
+            "usage": (
+                None
+                if usage is None
+                else {
+                    "prompt_tokens": usage.prompt_tokens,
+                    "completion_tokens": usage.completion_tokens,
+                    "total_tokens": usage.total_tokens,
+                }
+            ),
             "finish_reason": self.finish_reason,
             "tool_calls": self.tool_calls,
         }
@@ -51,7 +51,7 @@ class ProviderType(Enum):
     """Generic OpenAI-compatible endpoint"""
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServer:
     """
     Configuration for an MCP (Model Context Protocol) server.
@@ -94,7 +94,7 @@ class MCPServer:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AIProvider:
     """
     Configuration for an AI provider.
@@ -206,7 +206,7 @@ class AIProvider:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """
     Application configuration container.